@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Operation memory benchmark
+Compare current operation representation with plain (dict based) one
+"""
+
+from argparse import ArgumentParser
+import csv
+from datetime import datetime, timedelta
+import io
+import random
+import sys
+import tracemalloc
+from typing import Any, Callable, List
+
+from bank.internal import Operation
+from bank.utils import FMT_DATE, amount_from_str, parse_date
+
+class OperationDict():
+    """
+    Operation with per instance dict, as before slots
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, _date: datetime, mode: str,
+                 tier: str, cat: str, desc: str, amount: float) -> None:
+
+        self.date = _date
+        self.mode = mode
+        self.tier = tier
+        self.cat = cat
+        self.desc = desc
+        self.amount = amount
+
+def get_csv_str(ope_nb: int) -> str:
+    """
+    Get operation list CSV content
+    """
+
+    rnd = random.Random(0)
+    date_start = datetime(2015, 1, 1)
+    csv_file = io.StringIO()
+    writer = csv.writer(csv_file)
+    for idx in range(ope_nb):
+        writer.writerow([
+            (date_start + timedelta(days=idx // 8)).strftime(FMT_DATE),
+            rnd.choice(["cb", "vir", "chq", "prlv"]),
+            rnd.choice(["shop", "bank", "rent", "energy", "phone", "insurance"]),
+            rnd.choice(["food", "home", "misc", "car", "health"]),
+            f"desc {rnd.randrange(1000)}",
+            f"{rnd.uniform(-200, 200):.2f}",
+        ])
+
+    return csv_file.getvalue()
+
+def measure(name: str, init: Callable[[List[str]], Any], csv_str: str) -> int:
+    """
+    Measure memory held by operation list read from CSV content
+    """
+
+    tracemalloc.start()
+    ope_list = [init(row) for row in csv.reader(io.StringIO(csv_str))]
+    (size, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<24} : {size / len(ope_list):7.1f} B/operation, {size / 1024 / 1024:7.2f} MiB")
+
+    return size
+
+def main():
+    """
+    main
+    """
+
+    parser = ArgumentParser()
+    parser.add_argument("-n", "--ope-nb", type=int, action="store",
+        default=100000, help="number of operations")
+    args = parser.parse_args()
+
+    csv_str = get_csv_str(args.ope_nb)
+
+    print(f"{args.ope_nb} operations")
+
+    size_dict = measure("dict, strptime", lambda row: OperationDict(
+        datetime.strptime(row[0], FMT_DATE), row[1], row[2], row[3], row[4], float(row[5])),
+        csv_str)
+
+    parse_date.cache_clear()
+    size_slots = measure("slots, shared, cents", lambda row: Operation(
+        parse_date(row[0]), sys.intern(row[1]), sys.intern(row[2]), sys.intern(row[3]),
+        row[4], amount_from_str(row[5])), csv_str)
+
+    print(f"ratio : {size_slots / size_dict:.2f}")
+
+if __name__ == "__main__":
+    main()
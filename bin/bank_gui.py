@@ -1,52 +1,153 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser
-from datetime import date, datetime
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter, MultipleLocator
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+from datetime import date
+from operator import attrgetter
+import queue
+import threading
 import tkinter as tk
-from typing import Any, List, Dict
+from tkinter import ttk
+from typing import Any, Callable, List, Dict
+
+# matplotlib and numpy imported on first plot : window shows up right away
+from bank.internal import Account, Operation, Wallet
+from bank.display.my_matplotlib import (BAL_MAX, BAL_MIN, DATE_END, DATE_START, FMT_DATE_MONTH,
+    BalanceMatrixCache, get_month_idx_arr, parse_month, plot_balance,
+    setup_balance_ax, update_balance_line_list)
+from bank.utils import FMT_DATE, amount_to_float, amount_to_str, downsample_min_max
+
+class OpeTable():
+    """Operation table
+    Virtualized : rows inserted page by page when scrolled to the end
+    Sort permutation cached per column, filter on cached row text"""
+
+    COL_LIST = ["date", "mode", "tier", "cat", "desc", "amount"]
+
+    # Rows inserted at once
+    PAGE_LEN = 200
+
+    def __init__(self, parent: tk.Widget):
+        self.frame = tk.Frame(parent)
+
+        filter_frame = tk.Frame(self.frame)
+        filter_frame.pack(side="top", fill="x")
+        filter_label = tk.Label(filter_frame, text="Filter : ")
+        filter_label.pack(side="left")
+        self.filter_var = tk.StringVar(self.frame)
+        self.filter_var.trace_add("write", lambda *_: self.update_row_list())
+        filter_entry = tk.Entry(filter_frame, textvariable=self.filter_var)
+        filter_entry.pack(side="left", fill="x", expand=True)
+
+        self.tree = ttk.Treeview(self.frame, columns=self.COL_LIST, show="headings", height=25)
+        for col in self.COL_LIST:
+            self.tree.heading(col, text=col, command=lambda col=col: self.sort(col))
+            self.tree.column(col, width=80 if col != "desc" else 200,
+                anchor="e" if col == "amount" else "w")
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.tree.yview)
+        self.tree.config(yscrollcommand=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.ope_list: List[Operation] = []
+        # Column : operation indexes sorted by column
+        self.sort_dict: Dict[str, List[int]] = {}
+        self.sort_col: str = None
+        self.sort_reverse = False
+        # Lowercase row text, for filter
+        self.text_list: List[str] = None
+        # Displayed operation indexes, sorted and filtered, and number inserted
+        self.row_list: List[int] = []
+        self.row_nb = 0
+        self.page_pending = False
+
+    def set_ope_list(self, ope_list: List[Operation]):
+        self.ope_list = ope_list
+        self.sort_dict.clear()
+        self.sort_col = None
+        self.sort_reverse = False
+        self.text_list = None
+        self.update_row_list()
+
+    def get_sort(self, col: str):
+        if col not in self.sort_dict:
+            if col in ["date", "amount"]:
+                key: Callable[[Operation], Any] = attrgetter(col)
+            else:
+                key = lambda ope: getattr(ope, col).lower()
+            self.sort_dict[col] = sorted(range(len(self.ope_list)),
+                key=lambda idx: key(self.ope_list[idx]))
+        return self.sort_dict[col]
+
+    def sort(self, col: str):
+        """Sort by column, reversed if already sorted by it"""
+        if col == self.sort_col:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_col = col
+            self.sort_reverse = False
+        self.update_row_list()
+
+    def update_row_list(self):
+        idx_list = range(len(self.ope_list))
+        if self.sort_col is not None:
+            idx_list = self.get_sort(self.sort_col)
+            if self.sort_reverse:
+                idx_list = idx_list[::-1]
+
+        filter_str = self.filter_var.get().lower()
+        if filter_str:
+            if self.text_list is None:
+                self.text_list = [" ".join([ope.date.strftime(FMT_DATE), ope.mode, ope.tier, ope.cat,
+                    ope.desc, amount_to_str(ope.amount)]).lower() for ope in self.ope_list]
+            idx_list = [idx for idx in idx_list if filter_str in self.text_list[idx]]
+
+        self.row_list = list(idx_list)
+        self.row_nb = 0
+        self.tree.delete(*self.tree.get_children())
+        self.insert_page()
+        self.tree.yview_moveto(0)
+
+    def insert_page(self):
+        self.page_pending = False
+        for idx in self.row_list[self.row_nb:self.row_nb + self.PAGE_LEN]:
+            ope = self.ope_list[idx]
+            self.tree.insert("", tk.END, values=(ope.date.strftime(FMT_DATE), ope.mode,
+                ope.tier, ope.cat, ope.desc, amount_to_str(ope.amount)))
+        self.row_nb = min(self.row_nb + self.PAGE_LEN, len(self.row_list))
+
+    def on_scroll(self, first: str, last: str):
+        self.scrollbar.set(first, last)
+        if float(last) >= 1.0 and self.row_nb < len(self.row_list) and not self.page_pending:
+            # Scrolled to the end : next page, out of scroll callback
+            self.page_pending = True
+            self.tree.after_idle(self.insert_page)
 
-from bank.internal import Wallet
-from bank.utils import FMT_DATE
-
-FMT_DATE_MONTH = "%Y-%m"
-FMT_DATE_YEAR = "%Y"
-
-DATE_START = date(2019, 1, 1)
-DATE_END = date(2025, 12, 31)
-
-BAL_MIN = -5000
-BAL_MAX = 50000
-BAL_STEP_MAJ = 5000
-BAL_STEP_MIN = 1000
-
-def get_month_delta(_date: date):
-    return (_date.year - DATE_START.year) * 12 + _date.month - DATE_START.month
-
-def date_from_month_delta(month_delta: int):
-    return date(DATE_START.year + int(month_delta / 12), month_delta % 12 + 1, 1)
-
-def datetime_from_date(_date: date):
-    return datetime(_date.year, _date.month, _date.day)
+class App():
 
-def datetime_from_month_delta(month_delta: int):
-    return datetime_from_date(date_from_month_delta(month_delta))
+    ACCOUNT_NAME_FILTER_OUT = ["lbc"]
 
-def get_bal_str(bal: float):
-    return f"{int(bal):_}"
+    # Wallet load queue poll period (ms)
+    LOAD_POLL_PERIOD = 50
 
-class App():
+    def __init__(self, data_dir: str, wallet_name: str, jobs: int = 1, cache: bool = False,
+                 date_start: date = DATE_START, date_end: date = DATE_END,
+                 bal_min: int = BAL_MIN, bal_max: int = BAL_MAX):
+        # Set once loaded, accounts filled in as they are loaded
+        self.wallet: Wallet = None
+        self.account_list: List[Account] = []
 
-    ACCOUNT_NAME_FILTER_OUT = ["lbc"]
+        # Plotted range : months [date_start, date_end), balance in units
+        self.date_start = date_start
+        self.date_end = date_end
+        self.bal_min = bal_min
+        self.bal_max = bal_max
 
-    def __init__(self, data_dir: str, wallet_name: str):
-        wallet = Wallet(data_dir, wallet_name)
-        self.account_list = [acc for acc in wallet.account_list if acc.name not in self.ACCOUNT_NAME_FILTER_OUT]
+        # Balance matrix cache, set once wallet is loaded
+        # Extended with newly exposed months only, when date range changes
+        self.bal_matrix_cache: BalanceMatrixCache = None
 
         window = tk.Tk()
+        self.window = window
         window.title("Bank GUI")
         window.geometry("800x600")
         window.resizable(True, True)
@@ -55,8 +156,12 @@ class App():
         self.selected_view = tk.StringVar(window, value="data")
         self.selected_view_prev = "data"
 
-        self.test_label = tk.Label(window)
-        self.fig_widget = tk.Label(window)
+        # View widgets, built once on first selection
+        self.view_widget_dict: Dict[str, tk.Widget] = {}
+        self.plot_line_list = []
+        self.plot_canvas: "FigureCanvasTkAgg" = None
+        # Axes and canvas of each built figure, to update on range change
+        self.fig_ax_list: List[Any] = []
 
         top_frame = tk.Frame(window)
         top_frame.pack(side="top", fill="both")
@@ -69,6 +174,32 @@ class App():
         view_button_plot = tk.Radiobutton(top_frame, text="plot",
             variable=self.selected_view, value="plot", command=self.select_view)
         view_button_plot.pack(side="left", fill="y")
+        view_button_plot_ope = tk.Radiobutton(top_frame, text="plot operations",
+            variable=self.selected_view, value="plot_ope", command=self.select_view)
+        view_button_plot_ope.pack(side="left", fill="y")
+        # Plots need the whole wallet
+        self.plot_button_list = [view_button_plot, view_button_plot_ope]
+        for button in self.plot_button_list:
+            button.config(state="disabled")
+
+        # Range controls
+        self.date_start_var = tk.StringVar(window, value=self.date_start.strftime(FMT_DATE_MONTH))
+        self.date_end_var = tk.StringVar(window, value=self.date_end.strftime(FMT_DATE_MONTH))
+        self.bal_min_var = tk.StringVar(window, value=str(self.bal_min))
+        self.bal_max_var = tk.StringVar(window, value=str(self.bal_max))
+        range_label = tk.Label(top_frame, text="Dates : ")
+        range_label.pack(side="left", fill="y")
+        for (var, width) in [(self.date_start_var, 8), (self.date_end_var, 8)]:
+            tk.Entry(top_frame, textvariable=var, width=width).pack(side="left", fill="y")
+        bal_label = tk.Label(top_frame, text="Balance : ")
+        bal_label.pack(side="left", fill="y")
+        for (var, width) in [(self.bal_min_var, 8), (self.bal_max_var, 8)]:
+            tk.Entry(top_frame, textvariable=var, width=width).pack(side="left", fill="y")
+        range_button = tk.Button(top_frame, text="Apply", command=self.apply_range)
+        range_button.pack(side="left", fill="y")
+
+        self.load_label = tk.Label(top_frame, text="Loading wallet")
+        self.load_label.pack(side="right", fill="y")
 
         left_frame = tk.Frame(window)
         left_frame.pack(side="left", fill="both")
@@ -78,91 +209,174 @@ class App():
             if not sel:
                 return
             index = sel[0]
-            print(index)
+            self.ope_table.set_ope_list(
+                [ope for stat in self.account_list[index].stat_list for ope in stat.ope_list])
 
-        account_tklist = tk.Listbox(left_frame)
-        for (idx, account) in enumerate(self.account_list):
-            account_tklist.insert(idx, account.name)
-        account_tklist.pack(side="top", fill="both")
-        account_tklist.bind("<<ListboxSelect>>", on_account_select)
+        self.account_tklist = tk.Listbox(left_frame)
+        self.account_tklist.pack(side="top", fill="both")
+        self.account_tklist.bind("<<ListboxSelect>>", on_account_select)
 
         self.right_frame = tk.Frame(window)
-        self.right_frame.pack(side="right", fill="both")
+        self.right_frame.pack(side="right", fill="both", expand=True)
+
+        self.ope_table = OpeTable(self.right_frame)
+        self.view_widget_dict["data"] = self.show_data()
+        self.view_widget_dict["data"].pack(fill="both", expand=True)
+
+        # Wallet read in background, loaded accounts and wallet sent to Tk thread
+        self.load_queue: queue.Queue = queue.Queue()
+        load_thread = threading.Thread(target=self.load_wallet,
+            args=(data_dir, wallet_name, jobs, cache), daemon=True)
+        load_thread.start()
+        window.after(self.LOAD_POLL_PERIOD, self.poll_load)
 
         window.mainloop()
 
+    def load_wallet(self, data_dir: str, wallet_name: str, jobs: int, cache: bool):
+        """Read wallet, from load thread"""
+        try:
+            wallet = Wallet(data_dir, wallet_name, jobs, cache,
+                account_cb=lambda account: self.load_queue.put(("account", account)))
+        except Exception as exc: # pylint: disable=broad-except
+            self.load_queue.put(("error", exc))
+            return
+        self.load_queue.put(("wallet", wallet))
+
+    def poll_load(self):
+        """Handle loaded accounts and wallet, from Tk thread"""
+        while True:
+            try:
+                (kind, obj) = self.load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "account":
+                if obj.name in self.ACCOUNT_NAME_FILTER_OUT:
+                    continue
+                self.account_list += [obj]
+                self.account_tklist.insert(tk.END, obj.name)
+                self.load_label.config(text=f"Loading wallet : {len(self.account_list)} accounts")
+            elif kind == "wallet":
+                self.wallet = obj
+                self.bal_matrix_cache = BalanceMatrixCache(self.wallet, self.account_list)
+                self.load_label.config(text=f"{len(self.account_list)} accounts")
+                for button in self.plot_button_list:
+                    button.config(state="normal")
+                return
+            elif kind == "error":
+                self.load_label.config(text=f"Loading wallet failed : {obj}")
+                return
+        self.window.after(self.LOAD_POLL_PERIOD, self.poll_load)
+
     def select_view(self):
         selected_view = self.selected_view.get()
         if selected_view == self.selected_view_prev:
             return
+        if self.selected_view_prev in self.view_widget_dict:
+            # Hidden, not destroyed : reused when view is selected again
+            self.view_widget_dict[self.selected_view_prev].pack_forget()
         self.selected_view_prev = selected_view
-        if selected_view == "data":
-            self.fig_widget.destroy()
-            self.show_data()
-        elif selected_view == "plot":
-            self.test_label.destroy()
-            self.plot()
+        if selected_view not in self.view_widget_dict:
+            if selected_view == "plot":
+                self.view_widget_dict[selected_view] = self.plot()
+            elif selected_view == "plot_ope":
+                self.view_widget_dict[selected_view] = self.plot_ope()
+        self.view_widget_dict[selected_view].pack(fill="both", expand=True)
 
     def show_data(self):
-        self.test_label = tk.Label(self.right_frame, text="test")
-        self.test_label.pack()
+        return self.ope_table.frame
 
     def plot(self):
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(10, 7))
+        ax = fig.add_subplot()
+
+        # Total balance accross accounts, then balance of each account
+        self.plot_line_list = plot_balance(ax, self.account_list)
+
+        self.update_plot()
+        setup_balance_ax(ax, self.date_start, self.date_end, self.bal_min, self.bal_max)
+
+        (fig_widget, self.plot_canvas) = self.show_fig(fig)
+        self.fig_ax_list += [(ax, self.plot_canvas)]
+        return fig_widget
+
+    def update_plot(self):
+        """Update plot lines data, figure kept"""
+
+        update_balance_line_list(self.plot_line_list, self.bal_matrix_cache,
+            self.date_start, self.date_end)
+
+        if self.plot_canvas is not None:
+            self.plot_canvas.draw_idle()
+
+    def apply_range(self):
+        """Apply range from controls, invalid range rejected"""
+        try:
+            date_start = parse_month(self.date_start_var.get())
+            date_end = parse_month(self.date_end_var.get())
+            bal_min = int(self.bal_min_var.get())
+            bal_max = int(self.bal_max_var.get())
+        except ValueError:
+            date_start = date_end = None
+        if date_start is None or date_start >= date_end or bal_min >= bal_max:
+            # Restore current range
+            self.date_start_var.set(self.date_start.strftime(FMT_DATE_MONTH))
+            self.date_end_var.set(self.date_end.strftime(FMT_DATE_MONTH))
+            self.bal_min_var.set(str(self.bal_min))
+            self.bal_max_var.set(str(self.bal_max))
+            return
+
+        (self.date_start, self.date_end) = (date_start, date_end)
+        (self.bal_min, self.bal_max) = (bal_min, bal_max)
+
+        if len(self.plot_line_list) > 0:
+            self.update_plot()
+        for (ax, canvas) in self.fig_ax_list:
+            setup_balance_ax(ax, self.date_start, self.date_end, self.bal_min, self.bal_max)
+            canvas.draw_idle()
+
+    def plot_ope(self):
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(10, 7))
+        ax = fig.add_subplot()
+
+        # Running balance after each operation, total then each account
+        series_list = [self.wallet.get_ope_bal_series(self.account_list)]
+        series_list += [account.get_ope_bal_series() for account in self.account_list]
+        # x in month index, y in units
+        series_list = [(get_month_idx_arr(date_arr), amount_to_float(bal_arr))
+                       for (date_arr, bal_arr) in series_list]
+
+        line_list = plot_balance(ax, self.account_list, drawstyle="steps-post")
+
+        def downsample_line_list(ax):
+            # At most 2 points per pixel of visible range : min and max
+            (x_min, x_max) = ax.get_xlim()
+            bucket_nb = int(ax.bbox.width)
+            for (line, (x_arr, y_arr)) in zip(line_list, series_list):
+                line.set_data(*downsample_min_max(x_arr, y_arr, x_min, x_max, bucket_nb))
+
+        setup_balance_ax(ax, self.date_start, self.date_end, self.bal_min, self.bal_max)
+        downsample_line_list(ax)
+        ax.callbacks.connect("xlim_changed", downsample_line_list)
+
+        (fig_widget, canvas) = self.show_fig(fig)
+        self.fig_ax_list += [(ax, canvas)]
+        return fig_widget
+
+    def show_fig(self, fig):
+        from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg, NavigationToolbar2Tk)
 
-        fig, ax = plt.subplots(figsize=(10, 7))
-
-        month_delta_list = [md for md in range(get_month_delta(DATE_START), get_month_delta(DATE_END))]
-
-        # Plot total balance accross accounts
-        bal_total_list: List[float] = []
-        for month_delta in month_delta_list:
-            bal_total_list += [sum(acc.get_bal_at(datetime_from_month_delta(month_delta)) for acc in self.account_list)]
-        ax.plot(month_delta_list, bal_total_list, marker="", linestyle="-", color="grey", label="total")
-
-        # Plot balance for each account
-        for account in self.account_list:
-            color = "grey"
-            if "ce" in account.name.lower():
-                color = "red"
-            elif "nef" in account.name.lower():
-                color = "green"
-            elif "natixis" in account.name.lower():
-                color = "blue"
-            elif "carbon" in account.name.lower():
-                color = "orange"
-            bal_list = [account.get_bal_at(datetime_from_month_delta(md)) for md in month_delta_list]
-            ax.plot(month_delta_list, bal_list, marker="", linestyle="-", color=color, label=account.name)
-
-        ax.set_title("Balance evolution over time")
-
-        ax.set_xlim(get_month_delta(DATE_START), get_month_delta(DATE_END))
-        ax_x = ax.get_xaxis()
-        x_tick_major_list = [get_month_delta(date(year, 1, 1)) for year in range(DATE_START.year, DATE_END.year + 1)]
-        x_tick_minor_list: List[int] = []
-        for year in range(DATE_START.year, DATE_END.year + 1):
-            x_tick_minor_list += [get_month_delta(date(year, month, 1)) for month in range(1, 12 + 1)]
-        ax_x.set_ticks(x_tick_major_list)
-        ax_x.set_ticks(x_tick_minor_list, minor=True)
-        ax_x.set_ticklabels(str(date_from_month_delta(month_delta).year) for month_delta in x_tick_major_list)
-        ax_x.set_major_formatter(FuncFormatter(
-            lambda x, p: date_from_month_delta(int(x)).strftime(FMT_DATE_MONTH)))
-
-        ax.set_ylim(BAL_MIN, BAL_MAX)
-        ax_y = ax.get_yaxis()
-        ax_y.set_ticks([bal for bal in range(BAL_MIN, BAL_MAX, BAL_STEP_MAJ)])
-        ax_y.set_ticks([bal for bal in range(BAL_MIN, BAL_MAX, BAL_STEP_MIN)], minor=True)
-        ax_y.set_major_formatter(FuncFormatter(lambda x, p: get_bal_str(x)))
-
-        plt.xlabel("Date", loc="right")
-        plt.ylabel("Balance (EUR)", loc="top")
-        plt.grid(True, which="both", axis="both")
-        plt.grid(True, which="major", axis="both", color="black", linewidth=1)
-        plt.legend(loc="upper left")
-
-        canvas = FigureCanvasTkAgg(fig, self.right_frame)
+        # Canvas and its zoom toolbar
+        fig_widget = tk.Frame(self.right_frame)
+        canvas = FigureCanvasTkAgg(fig, fig_widget)
         canvas.draw()
-        self.fig_widget = canvas.get_tk_widget()
-        self.fig_widget.pack()
+        toolbar = NavigationToolbar2Tk(canvas, fig_widget)
+        toolbar.update()
+        canvas.get_tk_widget().pack()
+        return (fig_widget, canvas)
 
 def main():
     parser = ArgumentParser()
@@ -171,9 +385,22 @@ def main():
     parser.add_argument("wallet_name", type=str, action="store",
         default="main", help="wallet name")
     parser.add_argument("-d", "--debug", action="store_true", help="enable debug log")
+    parser.add_argument("-j", "--jobs", type=int, action="store",
+        default=1, help="number of workers reading wallet folders")
+    parser.add_argument("-c", "--cache", action="store_true",
+        help="use wallet snapshot cache for faster reopen")
+    parser.add_argument("--date-start", type=parse_month, action="store",
+        default=DATE_START, help="plot start month, included (YYYY-MM)")
+    parser.add_argument("--date-end", type=parse_month, action="store",
+        default=DATE_END, help="plot end month, excluded (YYYY-MM)")
+    parser.add_argument("--bal-min", type=int, action="store",
+        default=BAL_MIN, help="plot minimum balance")
+    parser.add_argument("--bal-max", type=int, action="store",
+        default=BAL_MAX, help="plot maximum balance")
     args = parser.parse_args()
 
-    app = App(args.data_dir, args.wallet_name)
+    app = App(args.data_dir, args.wallet_name, args.jobs, args.cache,
+        args.date_start, args.date_end, args.bal_min, args.bal_max)
 
 if __name__ == "__main__":
     main()
@@ -9,5 +9,7 @@ setup(
     version="0.1.0",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
-    scripts=["bin/bank_start"],
+    # bisect key argument
+    python_requires=">=3.10",
+    scripts=["bin/bank_start", "bin/bank_report"],
 )
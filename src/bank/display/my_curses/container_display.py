@@ -2,13 +2,17 @@
 display/curses/container
 """
 
-# import curses
+from bisect import bisect_left
+import curses
 from curses import (A_NORMAL, A_BOLD, A_STANDOUT)
-from typing import (Any, List)
+from datetime import datetime
+import time
+from typing import (Any, Callable, Dict, List, Tuple)
 
 from bank.display.my_curses.main import (KeyId, WinId, DisplayerMain)
 from bank.display.my_curses.item_display import DisplayerItem
 
+from bank.utils.my_date import FMT_DATE
 from bank.utils.return_code import RetCode
 
 class DisplayerContainer():
@@ -16,6 +20,14 @@ class DisplayerContainer():
     Curses container (account, statement) display
     """
 
+    # Keys only moving highlight, focus or selection : container and clipboard unchanged
+    KEY_NAV_LIST = [KeyId.UP, KeyId.DOWN, KeyId.SHIFT_UP, KeyId.SHIFT_DOWN,
+                    KeyId.PAGE_UP, KeyId.PAGE_DOWN, KeyId.HOME, KeyId.END,
+                    KeyId.SPACE, KeyId.CTRL_A]
+
+    # Keys removing last search query character
+    KEY_ERASE_LIST = [KeyId.BACKSPACE, KeyId.BACKSPACE_DEL, curses.KEY_BACKSPACE]
+
     def __init__(self, disp: DisplayerMain, item_disp: DisplayerItem) -> None:
 
         # Main display
@@ -27,15 +39,36 @@ class DisplayerContainer():
         self.title = ""
         self.subtitle = ""
 
-        # Highlighted item
+        # Highlighted item, and its index in container item list
+        # Index checked against item, looked up again only after container update
         self.item_hl: Any = None
+        self.item_hl_idx: int = -1
 
-        # Selected item list
-        self.item_sel_list: List[Any] = []
+        # Selection : all flag, and items toggled from it, by identity
+        self.item_sel_all: bool = False
+        self.item_sel_dict: Dict[int, Any] = {}
+
+        # Range selection : from anchor item to highlighted item, None if no range
+        self.item_sel_anchor: Any = None
+        self.item_sel_anchor_idx: int = -1
 
         # Focused item index
         self.item_focus_idx: int = 0
 
+        # Search query, and displayed container items matching it, None if no search
+        # Displayed item indexes, by identity
+        self.search_enabled: bool = False
+        self.search_query: str = ""
+        self.item_search_list: List[Any] = None
+        self.item_search_idx_dict: Dict[int, int] = None
+
+        # Left window line states drawn since last clear : only changed lines drawn
+        self.win_left_line_list: List[Any] = []
+        self.win_left_slider: Tuple[int, int, int] = None
+
+        # Info window to redraw : values computed only when container may have changed
+        self.win_info_dirty: bool = True
+
     def get_container_name(self) -> str:
         """Get container name"""
         return ""
@@ -44,6 +77,136 @@ class DisplayerContainer():
         """Get container item list"""
         return []
 
+    def get_container_item_idx(self, item: Any) -> int:
+        """
+        Get container item index, by identity
+        -1 if not found
+        """
+
+        for (idx, item_it) in enumerate(self.get_container_item_list()):
+            if item_it is item:
+                return idx
+
+        return -1
+
+    def search_container_item_list(self, query: str) -> List[Any]:
+        """Search container items matching query, if search enabled, None if no filter"""
+        _ = query
+        return None
+
+    def get_container_item_date(self, item: Any) -> datetime:
+        """Get container item date, container items sorted on it, None if not dated"""
+        _ = item
+        return None
+
+    def get_item_list(self) -> List[Any]:
+        """
+        Get displayed item list : search result if any, else container item list
+        """
+
+        if self.item_search_list is not None:
+            return self.item_search_list
+
+        return self.get_container_item_list()
+
+    def get_item_idx(self, item: Any) -> int:
+        """
+        Get displayed item index, by identity
+        -1 if not found
+        """
+
+        if self.item_search_list is None:
+            return self.get_container_item_idx(item)
+
+        return self.item_search_idx_dict.get(id(item), -1)
+
+    def set_search(self, query: str) -> None:
+        """
+        Set search query, displayed items filtered on it
+        Empty query for no search
+        """
+
+        self.search_query = query
+        self.update_search()
+
+    def update_search(self) -> None:
+        """
+        Update search result, after container update
+        """
+
+        item_search_list = None
+        if self.search_query.strip() != "":
+            item_search_list = self.search_container_item_list(self.search_query)
+
+        if item_search_list is None and self.item_search_list is None:
+            return
+
+        # Range selection on previous displayed items
+        self.end_range_sel()
+
+        # All selection on previous displayed items : selected ones kept, not the hidden ones
+        if self.item_sel_all:
+            self.item_sel_dict = {id(item): item for item in self.get_item_list()
+                                  if id(item) not in self.item_sel_dict}
+            self.item_sel_all = False
+
+        self.item_search_list = item_search_list
+        self.item_search_idx_dict = None
+        if item_search_list is not None:
+            self.item_search_idx_dict = {
+                id(item): idx for (idx, item) in enumerate(item_search_list)}
+
+        # Displayed items moved : highlighted item kept if displayed, else first one
+        self.set_item_hl_idx(max(self.get_item_hl_idx(), 0))
+        self.clear_win_left()
+
+    def draw_search(self) -> None:
+        """
+        Draw search query and result number on main window bottom border
+        """
+
+        win_main = self.disp.win_list[WinId.MAIN]
+        (win_main_h, win_main_w) = win_main.getmaxyx()
+
+        win_main.hline(win_main_h - 1, 1, curses.ACS_HLINE, win_main_w - 2)
+        if self.search_query != "":
+            item_nb = len(self.get_item_list())
+            search_str = f" /{self.search_query} ({item_nb}) "
+            win_main.addstr(win_main_h - 1, 2, search_str[:win_main_w - 4], A_BOLD)
+
+        win_main.noutrefresh()
+
+    def search(self) -> None:
+        """
+        Search mode : displayed items filtered as query is typed
+        ENTER to keep filter, ESC to clear it
+        """
+
+        if not self.search_enabled:
+            return
+
+        while True:
+
+            self.draw_search()
+            self.display_container_item_list(True, False)
+            curses.doupdate()
+
+            key = self.disp.get_key()
+
+            if key in [KeyId.ENTER]:
+                break
+
+            if key in [KeyId.ESC]:
+                self.set_search("")
+                break
+
+            if key in self.KEY_ERASE_LIST:
+                self.set_search(self.search_query[:-1])
+            elif 0 <= key < 256 and chr(key).isprintable():
+                self.set_search(self.search_query + chr(key))
+
+        self.draw_search()
+
     def edit_container_item(self, item: Any) -> bool:
         """Edit container item"""
         _ = item
@@ -99,42 +262,208 @@ class DisplayerContainer():
         """Remove cotnainer item"""
         _ = item
 
+    def get_item_hl_idx(self) -> int:
+        """
+        Get highlighted item index
+        -1 if no highlighted item in container
+        """
+
+        if self.item_hl is None:
+            return -1
+
+        item_list = self.get_item_list()
+        if (self.item_hl_idx < 0 or self.item_hl_idx >= len(item_list) or
+            item_list[self.item_hl_idx] is not self.item_hl):
+            # Container updated
+            self.item_hl_idx = self.get_item_idx(self.item_hl)
+
+        return self.item_hl_idx
+
+    def set_item_hl_idx(self, item_hl_idx: int) -> None:
+        """Highlight item at index, none if out of container"""
+
+        item_list = self.get_item_list()
+
+        if 0 <= item_hl_idx < len(item_list):
+            self.item_hl = item_list[item_hl_idx]
+            self.item_hl_idx = item_hl_idx
+        else:
+            self.item_hl = None
+            self.item_hl_idx = -1
+
     def highlight_item(self, delta: int) -> None:
         """Highlight item from offset to current"""
 
-        item_list = self.get_container_item_list()
+        item_hl_idx = self.get_item_hl_idx()
+        if item_hl_idx < 0:
+            return
 
-        if self.item_hl is None or len(item_list) == 0 or self.item_hl not in item_list:
+        item_hl_idx += delta
+        if item_hl_idx < 0 or item_hl_idx >= len(self.get_item_list()):
             return
 
-        item_hl_idx = item_list.index(self.item_hl) + delta
-        if item_hl_idx < 0 or item_hl_idx >= len(item_list):
+        self.set_item_hl_idx(item_hl_idx)
+
+    def goto_item(self, item_idx: int) -> None:
+        """
+        Highlight item at index, kept in container, and focus on it
+        """
+
+        item_nb = len(self.get_item_list())
+        if item_nb == 0:
+            return
+
+        item_idx = max(min(item_idx, item_nb - 1), 0)
+
+        self.set_item_hl_idx(item_idx)
+        # Highlighted item first displayed, focus kept in container
+        self.item_focus_idx = item_idx
+        self.move_focus(0)
+
+    def goto_date(self) -> None:
+        """
+        Go to first item at or after prompted date
+        Bisect on sorted item dates
+        """
+
+        item_list = self.get_item_list()
+        if len(item_list) == 0 or self.get_container_item_date(item_list[0]) is None:
+            # Items not dated
+            return
+
+        date_str = self.disp.display_prompt("GO TO DATE", f"date ({FMT_DATE})")
+        try:
+            _date = datetime.strptime(date_str, FMT_DATE)
+        except ValueError:
             return
 
-        self.item_hl = item_list[item_hl_idx]
+        self.goto_item(bisect_left(item_list, _date, key=self.get_container_item_date))
+
+    def goto_idx(self) -> None:
+        """
+        Go to item at prompted number, from 1
+        """
+
+        idx_str = self.disp.display_prompt("GO TO ITEM", f"number (1-{len(self.get_item_list())})")
+        try:
+            item_idx = int(idx_str) - 1
+        except ValueError:
+            return
+
+        self.goto_item(item_idx)
 
     def highlight_closest_item(self, item_list: List) -> None:
-        """Highlight closest item from list"""
-
-        item_hl_idx = 0
-        container_item_list = self.get_container_item_list()
-        if self.item_hl in container_item_list:
-            item_hl_idx = container_item_list.index(self.item_hl)
-
-        while item_hl_idx >= 0 and self.item_hl in item_list:
-            # Highligh previous item
-            item_hl_idx -= 1
-            if item_hl_idx >= 0:
-                self.item_hl = container_item_list[item_hl_idx]
-
-        while item_hl_idx < len(container_item_list) and self.item_hl in item_list:
-            # Highligh next item
-            item_hl_idx += 1
-            if item_hl_idx < len(container_item_list):
-                self.item_hl = container_item_list[item_hl_idx]
-
-        if self.item_hl in item_list:
-            self.item_hl = None
+        """Highlight closest item not in list : previous, else next"""
+
+        item_id_set = {id(item) for item in item_list}
+        if id(self.item_hl) not in item_id_set:
+            return
+
+        item_hl_idx = max(self.get_item_hl_idx(), 0)
+        container_item_list = self.get_item_list()
+
+        # Previous item not in list
+        item_closest_idx = item_hl_idx - 1
+        while item_closest_idx >= 0 and id(container_item_list[item_closest_idx]) in item_id_set:
+            item_closest_idx -= 1
+
+        if item_closest_idx < 0:
+            # Next item not in list
+            item_closest_idx = item_hl_idx + 1
+            while (item_closest_idx < len(container_item_list) and
+                   id(container_item_list[item_closest_idx]) in item_id_set):
+                item_closest_idx += 1
+
+        # None if out of container
+        self.set_item_hl_idx(item_closest_idx)
+
+    def is_item_sel(self, item: Any, item_idx: int = -1) -> bool:
+        """
+        Is item selected
+
+        Args:
+            item (Any): Item
+            item_idx (int): Item index in container, for range selection
+        """
+
+        if self.item_sel_anchor is not None and item_idx >= 0:
+            (range_start, range_end) = self.get_item_sel_range()
+            if range_start <= item_idx <= range_end:
+                return True
+
+        return (id(item) in self.item_sel_dict) != self.item_sel_all
+
+    def set_item_sel(self, item: Any, is_sel: bool) -> None:
+        """Set item selection"""
+
+        if is_sel != self.item_sel_all:
+            self.item_sel_dict[id(item)] = item
+        else:
+            self.item_sel_dict.pop(id(item), None)
+
+    def get_item_sel_range(self) -> Tuple[int, int]:
+        """
+        Get range selection (start, end) indexes, included
+        """
+
+        if (self.item_sel_anchor_idx < 0 or
+            self.item_sel_anchor_idx >= len(self.get_item_list()) or
+            self.get_item_list()[self.item_sel_anchor_idx] is not self.item_sel_anchor):
+            # Container updated
+            self.item_sel_anchor_idx = self.get_item_idx(self.item_sel_anchor)
+
+        item_hl_idx = self.get_item_hl_idx()
+        if self.item_sel_anchor_idx < 0 or item_hl_idx < 0:
+            return (0, -1)
+
+        return (min(self.item_sel_anchor_idx, item_hl_idx),
+                max(self.item_sel_anchor_idx, item_hl_idx))
+
+    def end_range_sel(self) -> None:
+        """End range selection : range items selected"""
+
+        if self.item_sel_anchor is None:
+            return
+
+        (range_start, range_end) = self.get_item_sel_range()
+        for item in self.get_item_list()[range_start:range_end + 1]:
+            self.set_item_sel(item, True)
+
+        self.item_sel_anchor = None
+        self.item_sel_anchor_idx = -1
+
+    def get_item_sel_list(self) -> List[Any]:
+        """
+        Get selected item list
+        Container order if all selected, else selection order
+        """
+
+        self.end_range_sel()
+
+        if self.item_sel_all:
+            return [item for item in self.get_item_list()
+                    if id(item) not in self.item_sel_dict]
+
+        return list(self.item_sel_dict.values())
+
+    def has_item_sel(self) -> bool:
+        """Is any item selected"""
+
+        if self.item_sel_anchor is not None:
+            return True
+
+        if self.item_sel_all:
+            return len(self.item_sel_dict) < len(self.get_item_list())
+
+        return len(self.item_sel_dict) > 0
+
+    def clear_item_sel(self) -> None:
+        """Clear selection"""
+
+        self.item_sel_all = False
+        self.item_sel_dict.clear()
+        self.item_sel_anchor = None
+        self.item_sel_anchor_idx = -1
 
     def toogle_item_sel(self) -> None:
         """Toogle selection of highlighted item"""
@@ -142,23 +471,32 @@ class DisplayerContainer():
         if self.item_hl is None:
             return
 
-        if self.item_hl not in self.item_sel_list:
-            self.item_sel_list.append(self.item_hl)
-        else:
-            self.item_sel_list.remove(self.item_hl)
+        self.end_range_sel()
+
+        self.set_item_sel(self.item_hl, not self.is_item_sel(self.item_hl))
 
     def select_all(self) -> None:
         """Select all items"""
-        self.item_sel_list.clear()
-        item_list = self.get_container_item_list()
-        for item in item_list:
-            self.item_sel_list.append(item)
+
+        self.clear_item_sel()
+        self.item_sel_all = True
+
+    def select_range(self, delta: int) -> None:
+        """Extend range selection from anchor, highlight item from offset to current"""
+
+        if self.item_sel_anchor is None:
+            if self.item_hl is None:
+                return
+            self.item_sel_anchor = self.item_hl
+            self.item_sel_anchor_idx = self.get_item_hl_idx()
+
+        self.highlight_item(delta)
 
     def copy(self) -> None:
         """Copy selected or highlited item(s)"""
 
-        if len(self.item_sel_list) > 0:
-            item_list = self.item_sel_list
+        if self.has_item_sel():
+            item_list = self.get_item_sel_list()
         elif self.item_hl is not None:
             item_list = [self.item_hl]
         else:
@@ -171,8 +509,8 @@ class DisplayerContainer():
         Cut selected or highlited item(s)
         """
 
-        if len(self.item_sel_list) > 0:
-            item_list = self.item_sel_list
+        if self.has_item_sel():
+            item_list = self.get_item_sel_list()
         elif self.item_hl is not None:
             item_list = [self.item_hl]
         else:
@@ -180,12 +518,11 @@ class DisplayerContainer():
 
         self.disp.item_list_clipboard.set(item_list)
 
-        if self.item_hl in item_list:
-            self.highlight_closest_item(item_list)
+        self.highlight_closest_item(item_list)
 
         self.remove_container_item_list(item_list, force=True)
 
-        self.item_sel_list.clear()
+        self.clear_item_sel()
 
     def paste(self) -> None:
         """
@@ -205,8 +542,8 @@ class DisplayerContainer():
         Rappr selected or highlited item(s)
         """
 
-        if len(self.item_sel_list) > 0:
-            item_list = self.item_sel_list
+        if self.has_item_sel():
+            item_list = self.get_item_sel_list()
         elif self.item_hl is not None:
             item_list = [self.item_hl]
         else:
@@ -221,13 +558,13 @@ class DisplayerContainer():
 
             self.remove_container_item_list(item_list, force=True)
 
-            self.item_sel_list.clear()
+            self.clear_item_sel()
 
     def remove_item(self) -> None:
         """Remove highlighted or selected item"""
 
-        if len(self.item_sel_list) != 0:
-            item_list = self.item_sel_list
+        if self.has_item_sel():
+            item_list = self.get_item_sel_list()
         elif self.item_hl is not None:
             item_list = [self.item_hl]
         else:
@@ -237,7 +574,7 @@ class DisplayerContainer():
 
         ret = self.remove_container_item_list(item_list)
         if ret == RetCode.OK:
-            self.item_sel_list.clear()
+            self.clear_item_sel()
 
     def save(self) -> None:
         """Save"""
@@ -267,6 +604,40 @@ class DisplayerContainer():
     def display_container_info(self) -> None:
         """Display container info"""
 
+    def get_item_disp_nb(self, item_list: List[Any]) -> int:
+        """Get number of displayed items"""
+
+        win_left_h: int = self.disp.win_list[WinId.LEFT].getmaxyx()[0]
+
+        return min(win_left_h - 5, len(item_list))
+
+    def move_focus(self, delta: int) -> None:
+        """
+        Move focus, kept in container
+        Highlighted item kept displayed : next batched keys act on a displayed item
+        """
+
+        item_list: List[Any] = self.get_item_list()
+
+        item_focus_idx_max = len(item_list) - self.get_item_disp_nb(item_list)
+        self.item_focus_idx = max(min(self.item_focus_idx + delta, item_focus_idx_max), 0)
+
+        self.fix_item_hl()
+
+    def fix_item_hl(self) -> None:
+        """Fix highlighted item after focus update : first or last displayed item"""
+
+        item_hl_idx = self.get_item_hl_idx()
+        if item_hl_idx < 0:
+            return
+
+        item_disp_nb: int = self.get_item_disp_nb(self.get_item_list())
+
+        if item_hl_idx < self.item_focus_idx:
+            self.set_item_hl_idx(self.item_focus_idx)
+        elif item_hl_idx > self.item_focus_idx + item_disp_nb - 1:
+            self.set_item_hl_idx(self.item_focus_idx + item_disp_nb - 1)
+
     def display_container_item_list(self, hl_changed: bool, focus_changed: bool) -> None:
         """
         Display list of items (statements or operations) in container
@@ -276,84 +647,64 @@ class DisplayerContainer():
             focus_changed (bool): Is focused item updated
         """
 
-        item_list: List[Any] = self.get_container_item_list()
+        item_list: List[Any] = self.get_item_list()
 
         win_left = self.disp.win_list[WinId.LEFT]
-        win_left_h: int = win_left.getmaxyx()[0]
 
         # Number of displayed items
-        item_disp_nb: int = win_left_h - 5
-        if len(item_list) < item_disp_nb:
-            item_disp_nb = len(item_list)
+        item_disp_nb: int = self.get_item_disp_nb(item_list)
 
-        if self.item_hl is None or self.item_hl not in item_list:
-            if len(item_list) != 0:
-                self.item_hl = item_list[0]
+        item_hl_idx = self.get_item_hl_idx()
+        if item_hl_idx < 0 and len(item_list) != 0:
+            item_hl_idx = 0
+            self.set_item_hl_idx(item_hl_idx)
+
+        # Focus in container, list may have shrunk
+        item_focus_idx_max = len(item_list) - item_disp_nb
+        self.item_focus_idx = max(min(self.item_focus_idx, item_focus_idx_max), 0)
 
-        if self.item_hl and self.item_hl in item_list:
+        if item_hl_idx >= 0:
 
             if hl_changed:
                 # Highlighted item updated
 
-                # Fix focus
-
-                item_hl_idx = item_list.index(self.item_hl)
-
-                # While highlited item above focus
-                while (item_hl_idx < self.item_focus_idx and
-                    self.item_focus_idx >= 0):
-
-                    # Move focus up
-                    self.item_focus_idx -= 1
-
-                # While highlited item below focus
-                while (item_hl_idx > self.item_focus_idx + item_disp_nb - 1 and
-                    self.item_focus_idx < len(item_list) - item_disp_nb):
-
-                    # Move focus down
-                    self.item_focus_idx += 1
+                # Fix focus : highlighted item displayed
+                if item_hl_idx < self.item_focus_idx:
+                    self.item_focus_idx = item_hl_idx
+                elif item_hl_idx > self.item_focus_idx + item_disp_nb - 1:
+                    self.item_focus_idx = min(item_hl_idx - item_disp_nb + 1, item_focus_idx_max)
 
             # Else, if focus updated
             elif focus_changed:
+                self.fix_item_hl()
 
-                # Fix focus
-
-                if self.item_focus_idx < 0:
-                    self.item_focus_idx = 0
-                elif self.item_focus_idx > len(item_list) - item_disp_nb:
-                    self.item_focus_idx = len(item_list) - item_disp_nb
-
-                # Fix highlighted item
-
-                item_hl_idx = item_list.index(self.item_hl)
-
-                if item_hl_idx < self.item_focus_idx:
-
-                    # Highlight first displayed item
-                    item_hl_idx = self.item_focus_idx
-                    self.item_hl = item_list[item_hl_idx]
-
-                elif item_hl_idx > self.item_focus_idx + item_disp_nb - 1:
+        (win_y, win_x) = (0, 0)
 
-                    # Highlight last displayed item
-                    item_hl_idx = self.item_focus_idx + item_disp_nb - 1
-                    self.item_hl = item_list[item_hl_idx]
+        def draw_line(line: Any, draw: Callable[..., None], *arg_list: Any) -> None:
+            # Draw line at win_y if its state changed
+            if win_y >= len(self.win_left_line_list):
+                self.win_left_line_list += [None] * (win_y + 1 - len(self.win_left_line_list))
+            if self.win_left_line_list[win_y] != line:
+                draw(*arg_list)
+                self.win_left_line_list[win_y] = line
 
-        (win_y, win_x) = (0, 0)
+        def draw_item_line(item: Any, item_y: int, disp_flag: int) -> None:
+            self.item_disp.set_item(item)
+            self.item_disp.display_item_line(win_left, item_y, win_x, disp_flag)
 
         # Item separator
-        win_left.addstr(win_y, win_x, self.item_disp.SEPARATOR)
+        draw_line("sep", lambda: win_left.addstr(win_y, win_x, self.item_disp.SEPARATOR))
         win_y += 1
 
         # Item header
-        win_left.addstr(win_y, win_x, self.item_disp.HEADER)
+        draw_line("header", lambda: win_left.addstr(win_y, win_x, self.item_disp.HEADER))
         win_y += 1
 
         # Item separator or missing
         if self.item_focus_idx == 0:
-            win_left.addstr(win_y, win_x, self.item_disp.SEPARATOR)
+            draw_line("sep", lambda: win_left.addstr(win_y, win_x, self.item_disp.SEPARATOR))
         else:
-            win_left.addstr(win_y, win_x, self.item_disp.MISSING)
+            draw_line("missing", lambda: win_left.addstr(win_y, win_x, self.item_disp.MISSING))
         win_y += 1
 
         # Item list
@@ -366,42 +717,53 @@ class DisplayerContainer():
             item = item_list[item_idx]
 
             disp_flag = A_NORMAL
-            if self.item_hl and item == self.item_hl:
+            if item is self.item_hl:
                 disp_flag += A_STANDOUT
-            if item in self.item_sel_list:
+            if self.is_item_sel(item, item_idx):
                 disp_flag += A_BOLD
 
-            self.item_disp.set_item(item)
-            self.item_disp.display_item_line(win_left, win_y, win_x, disp_flag)
-            # self.display_item_line(item, win_left, win_y, win_x, disp_flag)
+            # Same item, same flags : line unchanged
+            draw_line((id(item), disp_flag), draw_item_line, item, win_y, disp_flag)
             win_y += 1
 
         # Item separator or missing
         if item_idx == 0 or item_idx == len(item_list) - 1:
-            win_left.addstr(win_y, win_x, self.item_disp.SEPARATOR)
+            draw_line("sep", lambda: win_left.addstr(win_y, win_x, self.item_disp.SEPARATOR))
         else:
-            win_left.addstr(win_y, win_x, self.item_disp.MISSING)
+            draw_line("missing", lambda: win_left.addstr(win_y, win_x, self.item_disp.MISSING))
         win_y += 1
 
-        ope_disp_ratio = 0
-        if len(item_list) != 0:
-            ope_disp_ratio = item_disp_nb / len(item_list)
-
-        # Slider
-        (win_y, win_x) = (3, win_left.getyx()[1])
-        for _ in range(0, int(self.item_focus_idx * ope_disp_ratio)):
-            win_left.addstr(win_y, win_x, " ")
-            win_y += 1
-        for _ in range(int(self.item_focus_idx * ope_disp_ratio),
-                       int((self.item_focus_idx + item_disp_nb) * ope_disp_ratio)):
-            win_left.addstr(win_y, win_x, " ", A_STANDOUT)
-            win_y += 1
-        for _ in range(int((self.item_focus_idx + item_disp_nb) * ope_disp_ratio),
-                       int((len(item_list)) * ope_disp_ratio)):
-            win_left.addstr(win_y, win_x, " ")
-            win_y += 1
+        # Slider, right of separator
+        slider = (self.item_focus_idx, item_disp_nb, len(item_list))
+        if slider != self.win_left_slider:
+            self.win_left_slider = slider
 
-        win_left.refresh()
+            ope_disp_ratio = 0
+            if len(item_list) != 0:
+                ope_disp_ratio = item_disp_nb / len(item_list)
+
+            (win_y, win_x) = (3, len(self.item_disp.SEPARATOR))
+            for _ in range(0, int(self.item_focus_idx * ope_disp_ratio)):
+                win_left.addstr(win_y, win_x, " ")
+                win_y += 1
+            for _ in range(int(self.item_focus_idx * ope_disp_ratio),
+                           int((self.item_focus_idx + item_disp_nb) * ope_disp_ratio)):
+                win_left.addstr(win_y, win_x, " ", A_STANDOUT)
+                win_y += 1
+            for _ in range(int((self.item_focus_idx + item_disp_nb) * ope_disp_ratio),
+                           int((len(item_list)) * ope_disp_ratio)):
+                win_left.addstr(win_y, win_x, " ")
+                win_y += 1
+
+        # Screen updated once per frame, by browse_container
+        win_left.noutrefresh()
+
+    def clear_win_left(self) -> None:
+        """Clear left window, all lines drawn on next display"""
+
+        self.disp.win_list[WinId.LEFT].erase()
+        self.win_left_line_list.clear()
+        self.win_left_slider = None
 
     def draw_win_main(self):
         """Draw main window"""
@@ -412,7 +774,8 @@ class DisplayerContainer():
         win_main.addstr(0, int((win_main_w - len(self.title))/2), f" {self.title} ", A_STANDOUT)
         win_main.addstr(0, 2, f" {self.subtitle} ", A_BOLD)
         win_main.keypad(1)
-        win_main.refresh()
+        win_main.noutrefresh()
+        self.draw_search()
 
     def browse_container(self):
         """
@@ -420,109 +783,192 @@ class DisplayerContainer():
         """
 
         # Init
-        item_list: List[Any] = self.get_container_item_list()
         self.item_focus_idx: int = 0
-        self.item_hl = None
-        if len(item_list) != 0:
-            self.item_hl = item_list[0]
-        self.item_sel_list = []
+        self.clear_item_sel()
+        # Search query may be set by parent
+        self.update_search()
+        self.set_item_hl_idx(0)
 
+        self.clear_win_left()
         self.draw_win_main()
         self.display_container_info()
+        self.win_info_dirty = False
         self.display_container_item_list(False, False)
+        curses.doupdate()
 
-        win_main = self.disp.win_list[WinId.MAIN]
+        self.disp.frame_time = time.monotonic()
 
         while True:
 
             hl_changed = False
             focus_changed = False
 
-            key = win_main.getch()
-            # self.disp.add_log(str(key))
+            # Wait for key
+            key = self.disp.get_key()
+
+            # Batch of keys rendered once : pending navigation keys applied first
+            while True:
+
+                # self.disp.add_log(str(key))
+                (key_hl_changed, key_focus_changed, is_exit) = self.handle_key(key)
+                hl_changed |= key_hl_changed
+                focus_changed |= key_focus_changed
+
+                if is_exit:
+                    return
 
-            if key in [KeyId.UP]:
-                self.highlight_item(-1)
-                hl_changed = True
+                if key not in self.KEY_NAV_LIST:
+                    # Container, clipboard or info window may have changed
+                    # Like after child browse or edit
+                    self.win_info_dirty = True
+                    self.update_search()
+                    # Key may need display, like opening child, not batched further
+                    break
 
-            elif key in [KeyId.DOWN]:
-                self.highlight_item(1)
-                hl_changed = True
+                # Next pending key, waiting until next frame if frame rate is capped
+                key = self.disp.get_key_pending()
+                if key < 0:
+                    break
 
-            elif key in [KeyId.PAGE_UP]:
-                self.item_focus_idx -= 3
-                focus_changed = True
+            if self.win_info_dirty:
+                self.display_container_info()
+                self.win_info_dirty = False
+            self.display_container_item_list(hl_changed, focus_changed)
+            # Single screen update for all windows
+            curses.doupdate()
+            self.disp.frame_time = time.monotonic()
 
-            elif key in [KeyId.PAGE_DOWN]:
-                self.item_focus_idx += 3
-                focus_changed = True
+    def handle_key(self, key: int) -> Tuple[bool, bool, bool]:
+        """
+        Handle browse key
 
-            elif key in [KeyId.SPACE]:
-                self.toogle_item_sel()
+        Returns:
+            Tuple[bool, bool, bool]: (Is highlighted item updated, Is focus updated,
+                                      Is browse exited)
+        """
 
-            elif key in [KeyId.CTRL_A]:
-                self.select_all()
+        hl_changed = False
+        focus_changed = False
+        is_exit = False
 
-            elif key in [KeyId.CTRL_C]:
-                self.copy()
+        if key not in [KeyId.SHIFT_UP, KeyId.SHIFT_DOWN]:
+            self.end_range_sel()
+
+        if key in [KeyId.UP]:
+            self.highlight_item(-1)
+            hl_changed = True
+
+        elif key in [KeyId.DOWN]:
+            self.highlight_item(1)
+            hl_changed = True
+
+        elif key in [KeyId.SHIFT_UP]:
+            self.select_range(-1)
+            hl_changed = True
+
+        elif key in [KeyId.SHIFT_DOWN]:
+            self.select_range(1)
+            hl_changed = True
+
+        elif key in [KeyId.PAGE_UP]:
+            self.move_focus(-3)
+            focus_changed = True
 
-            elif key in [KeyId.CTRL_X]:
-                self.cut()
-                self.disp.win_list[WinId.LEFT].clear()
+        elif key in [KeyId.PAGE_DOWN]:
+            self.move_focus(3)
+            focus_changed = True
 
-            elif key in [KeyId.CTRL_V]:
-                self.paste()
+        elif key in [KeyId.HOME]:
+            self.goto_item(0)
+            focus_changed = True
 
-            elif key in [KeyId.CTRL_R]:
-                self.rappr()
-                self.disp.win_list[WinId.LEFT].clear()
+        elif key in [KeyId.END]:
+            self.goto_item(len(self.get_item_list()) - 1)
+            focus_changed = True
 
-            elif key in [KeyId.CTRL_E]:
-                # Edit highlighted item
-                self.edit_container_item(self.item_hl)
-                self.disp.win_list[WinId.LEFT].clear()
-                hl_changed = True
+        elif key in [KeyId.CTRL_G]:
+            self.goto_date()
+            focus_changed = True
 
-            elif key in [KeyId.ENTER]:
-                # Open highlighted item
-                self.browse_container_item(self.item_hl)
-                self.disp.win_list[WinId.LEFT].clear()
-                hl_changed = True
-                self.draw_win_main()
+        elif key in [KeyId.CTRL_N]:
+            self.goto_idx()
+            focus_changed = True
 
-            elif key in [KeyId.INS, KeyId.PLUS]:
-                # Add new item
-                item = self.create_container_item()
-                if item is not None:
-                    self.add_container_item(item)
-                    self.disp.win_list[WinId.LEFT].clear()
+        elif key in [KeyId.SPACE]:
+            self.toogle_item_sel()
 
-            elif key in [KeyId.DEL, KeyId.MINUS]:
-                self.remove_item()
-                self.disp.win_list[WinId.LEFT].clear()
+        elif key in [KeyId.CTRL_A]:
+            self.select_all()
 
-            elif key in [KeyId.CTRL_S]:
-                self.save()
+        elif key in [KeyId.CTRL_C]:
+            self.copy()
 
-            elif key in [KeyId.ESC, KeyId.BACKSPACE]:
-                ret = self.exit()
-                if ret == RetCode.OK:
-                    self.disp.cont_disp_last = self
-                    break
+        elif key in [KeyId.CTRL_X]:
+            self.cut()
+            self.clear_win_left()
 
-            elif key in [KeyId.CTRL_P]:
-                raise KeyboardInterrupt
+        elif key in [KeyId.CTRL_V]:
+            self.paste()
 
-            # else:
-            #     debug_key_str = f"key = {key} ({int(key)})"
-            #     print(debug_key_str)
-            #     win_main.addstr(0, 0, debug_key_str)
+        elif key in [KeyId.CTRL_R]:
+            self.rappr()
+            self.clear_win_left()
 
-            # item_list = self.get_container_item_list()
+        elif key in [KeyId.CTRL_E]:
+            # Edit highlighted item
+            self.edit_container_item(self.item_hl)
+            self.clear_win_left()
+            hl_changed = True
 
-            # if self.item_hl is None:
-            #     if len(item_list) != 0:
-            #         self.item_hl = item_list[0]
+        elif key in [KeyId.ENTER]:
+            # Open highlighted item
+            self.browse_container_item(self.item_hl)
+            self.clear_win_left()
+            hl_changed = True
+            self.draw_win_main()
 
-            self.display_container_info()
-            self.display_container_item_list(hl_changed, focus_changed)
+        elif key in [KeyId.INS, KeyId.PLUS]:
+            # Add new item
+            item = self.create_container_item()
+            if item is not None:
+                self.add_container_item(item)
+                self.clear_win_left()
+
+        elif key in [KeyId.DEL, KeyId.MINUS]:
+            self.remove_item()
+            self.clear_win_left()
+
+        elif key in [KeyId.CTRL_S]:
+            self.save()
+
+        elif key in [KeyId.SLASH]:
+            self.search()
+            hl_changed = True
+
+        elif key in [KeyId.ESC, KeyId.BACKSPACE] and self.search_query != "":
+            # Clear search before exit
+            self.set_search("")
+            self.draw_search()
+            hl_changed = True
+
+        elif key in [KeyId.ESC, KeyId.BACKSPACE]:
+            ret = self.exit()
+            if ret == RetCode.OK:
+                self.disp.cont_disp_last = self
+                is_exit = True
+
+        elif key in [KeyId.CTRL_P]:
+            raise KeyboardInterrupt
+
+        # else:
+        #     debug_key_str = f"key = {key} ({int(key)})"
+        #     print(debug_key_str)
+        #     win_main.addstr(0, 0, debug_key_str)
+
+        # item_list = self.get_container_item_list()
+
+        # if self.item_hl is None:
+        #     if len(item_list) != 0:
+        #         self.item_hl = item_list[0]
+
+        return (hl_changed, focus_changed, is_exit)
@@ -4,6 +4,7 @@ display/curses/implem/account
 
 import curses
 from curses import A_BOLD
+from datetime import datetime
 from typing import (Any, List, Tuple)
 
 from bank.display.my_curses.main import (ColorPairId, WinId, DisplayerMain)
@@ -15,6 +16,7 @@ from bank.display.my_curses.implem.main import (FieldLen, formart_trunc_padd, fo
 from bank.internal.account import Account
 from bank.internal.statement import Statement
 
+from bank.utils.amount import amount_to_str
 from bank.utils.return_code import RetCode
 from bank.utils.my_date import FMT_DATE
 
@@ -58,6 +60,8 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
         self.title = "ACCOUNT"
         self.subtitle = "STATEMENTS LIST"
 
+        self.search_enabled = True
+
     def get_container_name(self) -> str:
         """
         Get account name
@@ -94,7 +98,7 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
             self.account.set_name(val_str)
 
         if is_edited:
-            self.account.file_sync = False
+            self.account.info_sync = False
 
         return is_edited
 
@@ -105,6 +109,27 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
 
         return self.account.stat_list
 
+    def search_container_item_list(self, query: str) -> List[Statement]:
+        """
+        Search account statements with operations matching query
+        """
+
+        return self.account.search_stat(query)
+
+    def get_container_item_date(self, item: Statement) -> datetime:
+        """
+        Get statement date, account statement list sorted on it
+        """
+
+        return item.date
+
+    def get_container_item_idx(self, item: Statement) -> int:
+        """
+        Get account statement index, by identity
+        """
+
+        return self.account.get_stat_idx(item)
+
     def add_container_item(self, item: Statement) -> None:
         """
         Add account statement
@@ -120,13 +145,13 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
         # Top right window
         win = self.disp.win_list[WinId.RIGHT_TOP]
 
-        win.clear()
+        win.erase()
         win.border()
         win.addstr(0, 2, " INFO ", A_BOLD)
 
         (win_y, win_x) = (2, 2)
 
-        win.addstr(win_y, win_x, f"balance : {self.account.get_bal():.2f}")
+        win.addstr(win_y, win_x, f"balance : {amount_to_str(self.account.get_bal())}")
         win_y += 1
 
         win.addstr(win_y, win_x, "status : ")
@@ -140,7 +165,7 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
                    f"clipboard : {self.disp.item_list_clipboard.get_len()} operations")
         win_y += 1
 
-        win.refresh()
+        win.noutrefresh()
 
     def edit_container_item(self, item: Statement) -> None:
         """
@@ -153,7 +178,10 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
         stat_disp = DisplayerStatement(self.disp, item)
         is_edited = stat_disp.edit_item()
         if is_edited:
-            self.account.file_sync = False
+            # Statement date or balance may be edited : balance index to update
+            self.account.update_stat(item)
+            # Statement may be renamed : folder list to update
+            self.account.stat_list_sync = False
 
     def browse_container_item(self, item: Statement) -> None:
         """
@@ -164,8 +192,14 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
         """
 
         stat_disp = DisplayerStatement(self.disp, item)
+        # Statement operations filtered on account search
+        stat_disp.search_query = self.search_query
         stat_disp.browse_container()
 
+        # Statement date or balance may be edited, or read again from folder on discard :
+        # balance index to update
+        self.account.update_stat(item)
+
     def remove_container_item_list(self, item_list: List[Statement],
             force: bool = False) -> RetCode:
         """
@@ -180,6 +214,7 @@ class DisplayerAccount(DisplayerItem, DisplayerContainer):
 
         # Confirmed
         self.account.remove_stat_list(item_list)
+        self.item_disp.line_cache.invalidate_list(item_list)
         return RetCode.OK
 
     def create_container_item(self) -> Statement:
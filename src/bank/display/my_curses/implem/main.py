@@ -2,6 +2,11 @@
 display/curses/implem/main
 """
 
+from collections import OrderedDict
+from typing import (Any, Callable, List, Tuple)
+
+from bank.utils.amount import amount_to_str
+
 class FieldLen():
     """
     Length for display padding
@@ -34,7 +39,71 @@ def formart_trunc_padd(str_in: str, len_in: int) -> str:
 
     return str_out
 
-def format_amount(amount: float, str_len: int) -> str:
-    """Format amount to specified length
+def format_amount(amount: int, str_len: int) -> str:
+    """Format amount in cents to specified length
     with 2 decimals and left justified"""
-    return f"{amount:.2f}".rjust(str_len)
+    return amount_to_str(amount).rjust(str_len)
+
+class LineCache():
+    """
+    Item line render cache
+    Formatted line segments (text, attributes) by item identity and edit version
+    Scrolling replays cached segments, rebuilt only when item is edited
+    Least recently used lines dropped beyond a few screens
+    """
+
+    def __init__(self, line_nb_max: int = 1024) -> None:
+
+        # Item id : (item, version, segment list), least recently used first
+        # Item kept referenced : its id is not reused while cached
+        self.line_dict: OrderedDict = OrderedDict()
+        self.line_nb_max: int = line_nb_max
+
+    def get(self, item: Any, version: int,
+            build: Callable[[], List[Tuple[str, int]]]) -> List[Tuple[str, int]]:
+        """
+        Get item line segments, built if missing or outdated
+
+        Args:
+            item (Any): Item
+            version (int): Item edit version
+            build (Callable): Build item line segments
+        """
+
+        line = self.line_dict.get(id(item))
+        if line is None or line[0] is not item or line[1] != version:
+            line = (item, version, build())
+            self.line_dict[id(item)] = line
+            if len(self.line_dict) > self.line_nb_max:
+                self.line_dict.popitem(last=False)
+
+        self.line_dict.move_to_end(id(item))
+
+        return line[2]
+
+    def invalidate(self, item: Any) -> None:
+        """
+        Invalidate item line, rebuilt on next get
+        """
+
+        line = self.line_dict.get(id(item))
+        if line is not None and line[0] is item:
+            del self.line_dict[id(item)]
+
+    def invalidate_list(self, item_list: List[Any]) -> None:
+        """
+        Invalidate item lines, like for removed items
+        """
+
+        for item in item_list:
+            self.invalidate(item)
+
+def display_line(win: Any, win_y: int, win_x: int,
+                 segment_list: List[Tuple[str, int]], flag) -> None:
+    """
+    Display line segments, display flag added to segment attributes
+    """
+
+    win.move(win_y, win_x)
+    for (text, attr) in segment_list:
+        win.addstr(text, attr + flag)
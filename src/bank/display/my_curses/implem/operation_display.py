@@ -4,14 +4,16 @@ display/curses/implem/operation
 
 # import curses
 from datetime import datetime
-from typing import (Any, Tuple)
+from typing import (Any, List, Tuple)
 
 from bank.display.my_curses.main import (WinId, DisplayerMain)
 from bank.display.my_curses.item_display import DisplayerItem
-from bank.display.my_curses.implem.main import (FieldLen, formart_trunc_padd, format_amount)
+from bank.display.my_curses.implem.main import (FieldLen, LineCache, display_line,
+                                                formart_trunc_padd, format_amount)
 
 from bank.internal.operation import Operation
 
+from bank.utils.amount import (amount_from_str, amount_to_str)
 from bank.utils.my_date import FMT_DATE
 
 class DisplayerOperation(DisplayerItem):
@@ -54,6 +56,9 @@ class DisplayerOperation(DisplayerItem):
         # Operation
         self.operation: Operation = operation
 
+        # Operation lines, owned by display : freed with it
+        self.line_cache = LineCache()
+
         # Window
         self.win = disp.win_list[WinId.RIGHT_BOT]
 
@@ -83,6 +88,15 @@ class DisplayerOperation(DisplayerItem):
             flag ([type]): Display flag
         """
 
+        ope_line = self.line_cache.get(self.operation, 0, self.get_item_line)
+
+        display_line(win, win_y, win_x, ope_line, flag)
+
+    def get_item_line(self) -> List[Tuple[str, int]]:
+        """
+        Get item line segments (text, attributes)
+        """
+
         ope_line = "| "
         ope_line += formart_trunc_padd(self.operation.date.strftime(FMT_DATE), FieldLen.LEN_DATE)
         ope_line += " | "
@@ -97,7 +111,7 @@ class DisplayerOperation(DisplayerItem):
         ope_line += format_amount(self.operation.amount, FieldLen.LEN_AMOUNT)
         ope_line += " |"
 
-        win.addstr(win_y, win_x, ope_line, flag)
+        return [(ope_line, 0)]
 
     def get_item_field(self, field_idx) -> Tuple[str, str]:
         """
@@ -118,7 +132,7 @@ class DisplayerOperation(DisplayerItem):
         elif field_idx == Operation.FieldIdx.DESC:
             ret = ("desc", self.operation.desc)
         elif field_idx == Operation.FieldIdx.AMOUNT:
-            ret = ("amount", str(self.operation.amount))
+            ret = ("amount", amount_to_str(self.operation.amount))
 
         return ret
 
@@ -145,10 +159,13 @@ class DisplayerOperation(DisplayerItem):
             self.operation.desc = val_str
         elif field_idx == Operation.FieldIdx.AMOUNT:
             try:
-                self.operation.amount = float(val_str)
+                self.operation.amount = amount_from_str(val_str)
             except ValueError:
                 is_edited = False
 
+        if is_edited:
+            self.line_cache.invalidate(self.operation)
+
         return is_edited
 
     # def display(self):
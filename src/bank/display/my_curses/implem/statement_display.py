@@ -10,12 +10,14 @@ from typing import (Any, List, Tuple)
 from bank.display.my_curses.main import (ColorPairId, WinId, DisplayerMain)
 from bank.display.my_curses.item_display import DisplayerItem
 from bank.display.my_curses.container_display import DisplayerContainer
-from bank.display.my_curses.implem.main import (FieldLen, formart_trunc_padd, format_amount)
+from bank.display.my_curses.implem.main import (FieldLen, LineCache, display_line,
+                                                formart_trunc_padd, format_amount)
 from bank.display.my_curses.implem.operation_display import DisplayerOperation
 
 from bank.internal.statement import Statement
 from bank.internal.operation import Operation
 
+from bank.utils.amount import (amount_from_str, amount_to_str)
 from bank.utils.my_date import FMT_DATE
 from bank.utils.return_code import RetCode
 
@@ -76,11 +78,16 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         # Statement
         self.stat: Statement = stat
 
+        # Statement lines, rebuilt on statement version change, owned by display : freed with it
+        self.line_cache = LineCache()
+
         self.field_nb = Statement.FieldIdx.LAST + 1
 
         self.title = "STATEMENT"
         self.subtitle = "OPERATIONS LIST"
 
+        self.search_enabled = True
+
     def get_container_name(self) -> str:
         """
         Get statement name
@@ -106,9 +113,9 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         elif field_idx == Statement.FieldIdx.NAME:
             ret = ("name", self.stat.name)
         elif field_idx == Statement.FieldIdx.BAL_START:
-            ret = ("start balance", str(self.stat.bal_start))
+            ret = ("start balance", amount_to_str(self.stat.bal_start))
         elif field_idx == Statement.FieldIdx.BAL_END:
-            ret = ("end balance", str(self.stat.bal_end))
+            ret = ("end balance", amount_to_str(self.stat.bal_end))
 
         return ret
 
@@ -128,17 +135,18 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
             self.stat.set_name(val_str)
         elif field_idx == Statement.FieldIdx.BAL_START:
             try:
-                self.stat.bal_start = float(val_str)
+                self.stat.bal_start = amount_from_str(val_str)
             except ValueError:
                 is_edited = False
         elif field_idx == Statement.FieldIdx.BAL_END:
             try:
-                self.stat.bal_end = float(val_str)
+                self.stat.bal_end = amount_from_str(val_str)
             except ValueError:
                 is_edited = False
 
         if is_edited:
-            self.stat.file_sync = False
+            self.stat.info_sync = False
+            self.stat.version += 1
 
         return is_edited
 
@@ -149,6 +157,27 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
 
         return self.stat.ope_list
 
+    def search_container_item_list(self, query: str) -> List[Operation]:
+        """
+        Search statement operations matching query
+        """
+
+        return self.stat.search_ope(query)
+
+    def get_container_item_date(self, item: Operation) -> datetime:
+        """
+        Get operation date, statement operation list sorted on it
+        """
+
+        return item.date
+
+    def get_container_item_idx(self, item: Operation) -> int:
+        """
+        Get statement operation index, by identity
+        """
+
+        return self.stat.get_ope_idx(item)
+
     def add_container_item(self, item: Operation) -> None:
         """
         Add statement operation
@@ -175,6 +204,7 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
 
         # Confirmed
         self.stat.remove_ope_list(item_list)
+        self.item_disp.line_cache.invalidate_list(item_list)
         return RetCode.OK
 
     def remove_container_item(self, item: Operation) -> None:
@@ -186,6 +216,7 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         """
 
         self.stat.remove_ope(item)
+        self.item_disp.line_cache.invalidate(item)
 
     def edit_container_item(self, item: Operation) -> None:
         """
@@ -200,7 +231,9 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         self.stat.remove_ope(item)
 
         ope_disp = DisplayerOperation(self.disp, item)
-        ope_disp.edit_item()
+        if ope_disp.edit_item():
+            # Edited by another display : line to rebuild
+            self.item_disp.line_cache.invalidate(item)
 
         self.stat.add_ope(item)
 
@@ -217,7 +250,7 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         """
 
         # Init operation
-        operation: Operation = Operation(datetime.now(), "", "", "", "", 0.0)
+        operation: Operation = Operation(datetime.now(), "", "", "", "", 0)
 
         # Init operation display
         ope_disp = DisplayerOperation(self.disp, operation)
@@ -239,6 +272,18 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
             flag ([type]): Display flag
         """
 
+        stat_line = self.line_cache.get(self.stat, self.stat.version, self.get_item_line)
+
+        display_line(win, win_y, win_x, stat_line, flag)
+
+    def get_item_line(self) -> List[Tuple[str, int]]:
+        """
+        Get item line segments (text, attributes)
+        """
+
+        green = curses.color_pair(ColorPairId.GREEN_BLACK)
+        red = curses.color_pair(ColorPairId.RED_BLACK)
+
         stat_line = "| "
         stat_line += formart_trunc_padd(self.stat.date.strftime(FMT_DATE), FieldLen.LEN_DATE)
         stat_line += " | "
@@ -249,38 +294,28 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         stat_line += format_amount(self.stat.bal_end, FieldLen.LEN_AMOUNT)
         stat_line += " | "
 
-        win.addstr(win_y, win_x, stat_line, flag)
+        segment_list = [(stat_line, 0)]
 
-        bal_diff = round(self.stat.bal_end - self.stat.bal_start, 2)
-        if bal_diff >= 0.0:
-            win.addstr(format_amount(bal_diff, FieldLen.LEN_AMOUNT),
-                       curses.color_pair(ColorPairId.GREEN_BLACK) + flag)
-        else:
-            win.addstr(format_amount(bal_diff, FieldLen.LEN_AMOUNT),
-                       curses.color_pair(ColorPairId.RED_BLACK) + flag)
+        bal_diff = self.stat.bal_end - self.stat.bal_start
+        segment_list += [(format_amount(bal_diff, FieldLen.LEN_AMOUNT),
+                          green if bal_diff >= 0 else red)]
 
         if ENABLE_ACT_BAL_DIFF:
-            win.addstr(" | ", flag)
+            segment_list += [(" | ", 0)]
 
-            bal_act_diff = round(self.stat.ope_sum, 2)
-            if bal_act_diff >= 0.0:
-                win.addstr(format_amount(bal_act_diff, FieldLen.LEN_AMOUNT),
-                        curses.color_pair(ColorPairId.GREEN_BLACK) + flag)
-            else:
-                win.addstr(format_amount(bal_act_diff, FieldLen.LEN_AMOUNT),
-                        curses.color_pair(ColorPairId.RED_BLACK) + flag)
+            bal_act_diff = self.stat.ope_sum
+            segment_list += [(format_amount(bal_act_diff, FieldLen.LEN_AMOUNT),
+                              green if bal_act_diff >= 0 else red)]
 
-        win.addstr(" | ", flag)
+        segment_list += [(" | ", 0)]
 
-        bal_err = round(self.stat.bal_start + self.stat.ope_sum - self.stat.bal_end, 2)
-        if bal_err == 0.0:
-            win.addstr(format_amount(bal_err, FieldLen.LEN_AMOUNT),
-                       curses.color_pair(ColorPairId.GREEN_BLACK) + flag)
-        else:
-            win.addstr(format_amount(bal_err, FieldLen.LEN_AMOUNT),
-                       curses.color_pair(ColorPairId.RED_BLACK) + flag)
+        bal_err = self.stat.bal_start + self.stat.ope_sum - self.stat.bal_end
+        segment_list += [(format_amount(bal_err, FieldLen.LEN_AMOUNT),
+                          green if bal_err == 0 else red)]
+
+        segment_list += [(" |", 0)]
 
-        win.addstr(" |", flag)
+        return segment_list
 
     def display_container_info(self) -> None:
         """
@@ -290,7 +325,7 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         # Top right window
         win = self.disp.win_list[WinId.RIGHT_TOP]
 
-        win.clear()
+        win.erase()
         win.border()
         win.addstr(0, 2, " INFO ", A_BOLD)
 
@@ -301,39 +336,41 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
         win.addstr(win_y, win_x, f"name : {self.stat.name}")
         win_y += 1
 
-        win.addstr(win_y, win_x, f"balance start : {self.stat.bal_start}")
+        win.addstr(win_y, win_x, f"balance start : {amount_to_str(self.stat.bal_start)}")
         win_y += 1
 
-        win.addstr(win_y, win_x, f"balance end : {self.stat.bal_end}")
+        win.addstr(win_y, win_x, f"balance end : {amount_to_str(self.stat.bal_end)}")
         win_y += 1
 
-        bal_diff = round(self.stat.bal_end - self.stat.bal_start, 2)
+        bal_diff = self.stat.bal_end - self.stat.bal_start
         win.addstr(win_y, win_x, "balance diff : ")
-        if bal_diff >= 0.0:
-            win.addstr(str(bal_diff), curses.color_pair(ColorPairId.GREEN_BLACK))
+        if bal_diff >= 0:
+            win.addstr(amount_to_str(bal_diff), curses.color_pair(ColorPairId.GREEN_BLACK))
         else:
-            win.addstr(str(bal_diff), curses.color_pair(ColorPairId.RED_BLACK))
+            win.addstr(amount_to_str(bal_diff), curses.color_pair(ColorPairId.RED_BLACK))
         win_y += 1
 
         win.addstr(win_y, win_x,
-                   f"actual end : {(self.stat.bal_start + self.stat.ope_sum):.2f}")
+                   f"actual end : {amount_to_str(self.stat.bal_start + self.stat.ope_sum)}")
         win_y += 1
 
         if ENABLE_ACT_BAL_DIFF:
-            bal_act_diff = round(self.stat.ope_sum, 2)
+            bal_act_diff = self.stat.ope_sum
             win.addstr(win_y, win_x, "actual balance diff : ")
-            if bal_act_diff >= 0.0:
-                win.addstr(str(bal_act_diff), curses.color_pair(ColorPairId.GREEN_BLACK))
+            if bal_act_diff >= 0:
+                win.addstr(amount_to_str(bal_act_diff),
+                           curses.color_pair(ColorPairId.GREEN_BLACK))
             else:
-                win.addstr(str(bal_act_diff), curses.color_pair(ColorPairId.RED_BLACK))
+                win.addstr(amount_to_str(bal_act_diff),
+                           curses.color_pair(ColorPairId.RED_BLACK))
             win_y += 1
 
-        bal_err = round(self.stat.bal_start + self.stat.ope_sum - self.stat.bal_end, 2)
+        bal_err = self.stat.bal_start + self.stat.ope_sum - self.stat.bal_end
         win.addstr(win_y, win_x, "balance error : ")
-        if bal_err == 0.0:
-            win.addstr(str(bal_err), curses.color_pair(ColorPairId.GREEN_BLACK))
+        if bal_err == 0:
+            win.addstr(amount_to_str(bal_err), curses.color_pair(ColorPairId.GREEN_BLACK))
         else:
-            win.addstr(str(bal_err), curses.color_pair(ColorPairId.RED_BLACK))
+            win.addstr(amount_to_str(bal_err), curses.color_pair(ColorPairId.RED_BLACK))
         win_y += 1
 
         win.addstr(win_y, win_x, "status : ")
@@ -354,7 +391,7 @@ class DisplayerStatement(DisplayerItem, DisplayerContainer):
             win.addstr(win_y, win_x, "last stat : None")
         win_y += 1
 
-        win.refresh()
+        win.noutrefresh()
 
     def save(self) -> None:
         """
@@ -13,6 +13,7 @@ from bank.display.my_curses.implem.account_display import DisplayerAccount
 from bank.internal.account import Account
 from bank.internal.wallet import Wallet
 
+from bank.utils.amount import amount_to_str
 from bank.utils.return_code import RetCode
 
 class DisplayerWallet(DisplayerContainer):
@@ -56,13 +57,13 @@ class DisplayerWallet(DisplayerContainer):
         # Top right window
         win = self.disp.win_list[WinId.RIGHT_TOP]
 
-        win.clear()
+        win.erase()
         win.border()
         win.addstr(0, 2, " INFO ", A_BOLD)
 
         (win_y, win_x) = (2, 2)
 
-        win.addstr(win_y, win_x, f"balance : {self.wallet.get_bal():.2f}")
+        win.addstr(win_y, win_x, f"balance : {amount_to_str(self.wallet.get_bal())}")
         win_y += 1
 
         win.addstr(win_y, win_x, "status : ")
@@ -76,7 +77,7 @@ class DisplayerWallet(DisplayerContainer):
                    f"clipboard : {self.disp.item_list_clipboard.get_len()} operations")
         win_y += 1
 
-        win.refresh()
+        win.noutrefresh()
 
     def edit_container_item(self, item: Account) -> None:
         """
@@ -89,7 +90,8 @@ class DisplayerWallet(DisplayerContainer):
         account_disp = DisplayerAccount(self.disp, item)
         is_edited = account_disp.edit_item()
         if is_edited:
-            self.wallet.file_sync = False
+            # Account may be renamed : folder list to update
+            self.wallet.account_list_sync = False
 
     def browse_container_item(self, item: Account) -> None:
         """
@@ -5,6 +5,7 @@ display/curses/main
 import curses
 from curses import (A_NORMAL, A_BOLD, A_STANDOUT)
 from enum import IntEnum
+import time
 from typing import (Any, List)
 
 from bank.utils.clipboard import Clipboard
@@ -35,8 +36,10 @@ class KeyId(IntEnum):
     CTRL_C = -1
     CTRL_A = 1
     CTRL_E = 5
+    CTRL_G = 7
     BACKSPACE = 8
     ENTER = 10
+    CTRL_N = 14
     CTRL_P = 16
     CTRL_R = 18
     CTRL_S = 19
@@ -46,12 +49,18 @@ class KeyId(IntEnum):
     SPACE = 32
     PLUS = 43
     MINUS = 45
+    SLASH = 47
+    BACKSPACE_DEL = 127
     DOWN = 258
     UP = 259
+    HOME = 262
     DEL = 330
     INS = 331
+    SHIFT_DOWN = 336
+    SHIFT_UP = 337
     PAGE_DOWN = 338
     PAGE_UP = 339
+    END = 360
 
 class DisplayerMain():
     """
@@ -63,7 +72,7 @@ class DisplayerMain():
     BORDER_H = 1
     BORDER_W = BORDER_H
 
-    def __init__(self, win_main: Any) -> None:
+    def __init__(self, win_main: Any, fps_max: int = 0) -> None:
 
         # Windows list
         self.win_list: List[Any] = [None] * (WinId.LAST + 1)
@@ -74,6 +83,11 @@ class DisplayerMain():
         # Last browsed container displayer
         self.cont_disp_last: Any = None
 
+        # Minimum time between screen updates (s), 0 if frame rate not capped
+        self.frame_period: float = 1 / fps_max if fps_max > 0 else 0
+        # Last screen update time, from time.monotonic
+        self.frame_time: float = 0
+
         # Main window
         (win_main_h, win_main_w) = win_main.getmaxyx()
         self.win_list[WinId.MAIN] = win_main
@@ -107,6 +121,35 @@ class DisplayerMain():
         curses.init_pair(ColorPairId.RED_BLACK, curses.COLOR_RED, curses.COLOR_BLACK)
         curses.init_pair(ColorPairId.GREEN_BLACK, curses.COLOR_GREEN, curses.COLOR_BLACK)
 
+    def get_key(self) -> int:
+        """
+        Wait for key on main window
+        """
+
+        return self.win_list[WinId.MAIN].getch()
+
+    def get_key_pending(self) -> int:
+        """
+        Get pending key on main window, without waiting
+        If frame rate is capped, wait for key until next frame time
+
+        Returns:
+            int: Key, negative if none
+            CTRL_C (interrupted read) not distinguished from no key : only got by get_key
+        """
+
+        win_main = self.win_list[WinId.MAIN]
+
+        # Time left before next frame (ms)
+        wait_ms = int((self.frame_time + self.frame_period - time.monotonic()) * 1000)
+
+        win_main.timeout(max(wait_ms, 0))
+        key = win_main.getch()
+        # Back to blocking
+        win_main.timeout(-1)
+
+        return key
+
     def add_log(self, msg: str) -> None:
         """
         Add log message
@@ -128,6 +171,39 @@ class DisplayerMain():
         win = self.win_list[WinId.RIGHT_BOT]
         win.clear()
 
+    def display_prompt(self, name: str, msg: str) -> str:
+        """
+        Display prompt, get input string
+
+        Returns:
+            str: Input string, empty if none
+        """
+
+        # Bottom right window
+        win = self.win_list[WinId.RIGHT_BOT]
+
+        win.clear()
+        win.border()
+        win.addstr(0, 2, f" {name} ", A_BOLD)
+        win.addstr(2, 2, f"{msg} : ")
+
+        win.keypad(False)
+        curses.echo()
+
+        val_str = ""
+        try:
+            val_str = win.getstr().decode(encoding="utf-8")
+        except UnicodeDecodeError:
+            pass
+
+        win.keypad(True)
+        curses.noecho()
+
+        win.clear()
+        win.noutrefresh()
+
+        return val_str.strip()
+
     def display_choice_menu(self, name: str, msg: str, choice_list: List[str]) -> int:
         """
         Display choice menu
@@ -0,0 +1,10 @@
+"""
+bank/display/my_matplotlib init
+Not imported by bank/display : only for plotting applications
+"""
+
+from .balance_plot import (BAL_MAX, BAL_MIN, BAL_STEP_MAJ, BAL_STEP_MIN, DATE_END, DATE_START,
+                           FMT_DATE_MONTH, BalanceMatrixCache, date_from_month_idx,
+                           datetime_from_month_idx, get_account_color, get_bal_str,
+                           get_month_idx, get_month_idx_arr, parse_month, plot_balance,
+                           render_balance, setup_balance_ax, update_balance_line_list)
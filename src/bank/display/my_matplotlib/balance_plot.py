@@ -0,0 +1,248 @@
+"""
+display/my_matplotlib/balance_plot
+Balance evolution chart, shared by GUI and headless report
+matplotlib and numpy imported on first use : no GUI toolkit imported
+"""
+
+from datetime import (date, datetime)
+from typing import (Any, List, Tuple)
+
+from bank.internal.account import Account
+from bank.internal.wallet import Wallet
+from bank.utils.amount import amount_to_float
+
+FMT_DATE_MONTH = "%Y-%m"
+
+# Default date range : start month included, end month excluded
+DATE_START = date(2019, 1, 1)
+DATE_END = date(2025, 12, 1)
+
+# Default balance range, in units
+BAL_MIN = -5000
+BAL_MAX = 50000
+BAL_STEP_MAJ = 5000
+BAL_STEP_MIN = 1000
+
+def parse_month(month_str: str) -> date:
+    """
+    Parse month (first day) from string, like "2019-01"
+
+    Raises:
+        ValueError: Not a month string
+    """
+
+    return datetime.strptime(month_str, FMT_DATE_MONTH).date()
+
+def get_month_idx(_date: date) -> int:
+    """
+    Get absolute month index, independent of plotted date range
+    """
+
+    return _date.year * 12 + _date.month - 1
+
+def date_from_month_idx(month_idx: int) -> date:
+    """
+    Get month first day from absolute month index
+    """
+
+    return date(month_idx // 12, month_idx % 12 + 1, 1)
+
+def datetime_from_month_idx(month_idx: int) -> datetime:
+    """
+    Get month first day from absolute month index
+    """
+
+    _date = date_from_month_idx(month_idx)
+
+    return datetime(_date.year, _date.month, _date.day)
+
+def get_month_idx_arr(date_arr: "numpy.ndarray") -> "numpy.ndarray":
+    """
+    Get absolute month index of datetime64 dates, with elapsed fraction of month
+    """
+
+    import numpy as np # pylint: disable=import-outside-toplevel
+
+    month_arr = date_arr.astype("datetime64[M]")
+    month_start_arr = month_arr.astype(date_arr.dtype)
+    month_len_arr = (month_arr + 1).astype(date_arr.dtype) - month_start_arr
+    # datetime64[M] counts months from 1970-01
+    month_idx_epoch = get_month_idx(date(1970, 1, 1))
+    month_idx_arr = (month_arr.astype(np.int64) + month_idx_epoch).astype(np.float64)
+
+    return month_idx_arr + (date_arr - month_start_arr) / month_len_arr
+
+def get_bal_str(bal: float) -> str:
+    """
+    Format balance axis tick
+    """
+
+    return f"{int(bal):_}"
+
+def get_account_color(account_name: str) -> str:
+    """
+    Get account line color
+    """
+
+    color = "grey"
+    if "ce" in account_name.lower():
+        color = "red"
+    elif "nef" in account_name.lower():
+        color = "green"
+    elif "natixis" in account_name.lower():
+        color = "blue"
+    elif "carbon" in account_name.lower():
+        color = "orange"
+
+    return color
+
+class BalanceMatrixCache():
+    """
+    Monthly balance matrix of wallet accounts
+    Extended with newly requested months only, then sliced
+    """
+
+    def __init__(self, wallet: Wallet, account_list: List[Account] = None) -> None:
+
+        self.wallet: Wallet = wallet
+        self.account_list: List[Account] = (wallet.account_list if account_list is None
+                                            else account_list)
+
+        # Balance in cents, columns are months from month_start
+        self.bal_matrix: "numpy.ndarray" = None
+        self.month_start: int = 0
+
+    def _compute(self, month_start: int, month_end: int) -> "numpy.ndarray":
+
+        return self.wallet.get_bal_matrix(
+            [datetime_from_month_idx(month_idx) for month_idx in range(month_start, month_end)],
+            self.account_list)
+
+    def get(self, month_start: int, month_end: int) -> "numpy.ndarray":
+        """
+        Get balance matrix over months [month_start, month_end)
+
+        Args:
+            month_start (int): Start absolute month index, included
+            month_end (int): End absolute month index, excluded
+
+        Returns:
+            numpy.ndarray: Balance in cents, int64, shape (accounts, months), not to be modified
+        """
+
+        import numpy as np # pylint: disable=import-outside-toplevel
+
+        if self.bal_matrix is None:
+            self.bal_matrix = self._compute(month_start, month_end)
+            self.month_start = month_start
+
+        else:
+            cache_start = self.month_start
+            cache_end = cache_start + self.bal_matrix.shape[1]
+            if month_start < cache_start:
+                self.bal_matrix = np.concatenate(
+                    (self._compute(month_start, cache_start), self.bal_matrix), axis=1)
+                self.month_start = month_start
+            if month_end > cache_end:
+                self.bal_matrix = np.concatenate(
+                    (self.bal_matrix, self._compute(cache_end, month_end)), axis=1)
+
+        col_start = month_start - self.month_start
+
+        return self.bal_matrix[:, col_start:col_start + month_end - month_start]
+
+def setup_balance_ax(ax: Any, date_start: date, date_end: date,
+                     bal_min: int, bal_max: int) -> None:
+    """
+    Setup balance axes : title, range, ticks, labels, grid and legend
+    Months [date_start, date_end) on x axis, balance in units on y axis
+    """
+
+    from matplotlib.ticker import FuncFormatter # pylint: disable=import-outside-toplevel
+
+    ax.set_title("Balance evolution over time")
+
+    ax.set_xlim(get_month_idx(date_start), get_month_idx(date_end))
+    ax_x = ax.get_xaxis()
+    x_tick_major_list = [get_month_idx(date(year, 1, 1))
+                         for year in range(date_start.year, date_end.year + 1)]
+    x_tick_minor_list: List[int] = []
+    for year in range(date_start.year, date_end.year + 1):
+        x_tick_minor_list += [get_month_idx(date(year, month, 1)) for month in range(1, 12 + 1)]
+    ax_x.set_ticks(x_tick_major_list)
+    ax_x.set_ticks(x_tick_minor_list, minor=True)
+    ax_x.set_ticklabels(str(date_from_month_idx(month_idx).year) for month_idx in x_tick_major_list)
+    ax_x.set_major_formatter(FuncFormatter(
+        lambda x, p: date_from_month_idx(int(x)).strftime(FMT_DATE_MONTH)))
+
+    ax.set_ylim(bal_min, bal_max)
+    ax_y = ax.get_yaxis()
+    ax_y.set_ticks(list(range(bal_min, bal_max, BAL_STEP_MAJ)))
+    ax_y.set_ticks(list(range(bal_min, bal_max, BAL_STEP_MIN)), minor=True)
+    ax_y.set_major_formatter(FuncFormatter(lambda x, p: get_bal_str(x)))
+
+    ax.set_xlabel("Date", loc="right")
+    ax.set_ylabel("Balance (EUR)", loc="top")
+    ax.grid(True, which="both", axis="both")
+    ax.grid(True, which="major", axis="both", color="black", linewidth=1)
+    ax.legend(loc="upper left")
+
+def plot_balance(ax: Any, account_list: List[Account], drawstyle: str = "default") -> List[Any]:
+    """
+    Create empty balance lines : total across accounts, then each account
+
+    Returns:
+        List[Line2D]: Lines, data to set
+    """
+
+    line_list = []
+    for (line_idx, label) in enumerate(["total"] + [account.name for account in account_list]):
+        color = "grey" if line_idx == 0 else get_account_color(label)
+        (line,) = ax.plot([], [], marker="", linestyle="-", drawstyle=drawstyle,
+                          color=color, label=label)
+        line_list += [line]
+
+    return line_list
+
+def update_balance_line_list(line_list: List[Any], bal_matrix_cache: BalanceMatrixCache,
+                             date_start: date, date_end: date) -> None:
+    """
+    Set balance lines data over months [date_start, date_end), from matrix cache
+    """
+
+    month_idx_list = range(get_month_idx(date_start), get_month_idx(date_end))
+
+    # Balance of each account at each month, in units
+    bal_matrix = amount_to_float(bal_matrix_cache.get(month_idx_list.start, month_idx_list.stop))
+
+    line_list[0].set_data(month_idx_list, bal_matrix.sum(axis=0))
+    for (account_idx, line) in enumerate(line_list[1:]):
+        line.set_data(month_idx_list, bal_matrix[account_idx])
+
+def render_balance(file_name: str, bal_matrix_cache: BalanceMatrixCache,
+                   date_start: date = DATE_START, date_end: date = DATE_END,
+                   bal_min: int = BAL_MIN, bal_max: int = BAL_MAX,
+                   fig_size: Tuple[float, float] = (10, 7)) -> None:
+    """
+    Render balance chart to file, without display
+    Format from file extension, like png or svg
+
+    Args:
+        file_name (str): Output file
+        bal_matrix_cache (BalanceMatrixCache): Wallet balance matrix, reused between charts
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Not registered in pyplot : freed once rendered
+    fig = Figure(figsize=fig_size)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    line_list = plot_balance(ax, bal_matrix_cache.account_list)
+    update_balance_line_list(line_list, bal_matrix_cache, date_start, date_end)
+    setup_balance_ax(ax, date_start, date_end, bal_min, bal_max)
+
+    fig.savefig(file_name)
@@ -6,3 +6,4 @@ from .wallet import Wallet
 from .account import Account
 from .statement import Statement
 from .operation import Operation
+from .ope_index import OpeIndex
@@ -2,16 +2,21 @@
 Account
 """
 
+from bisect import (bisect_left, bisect_right)
+from concurrent.futures import Executor
 from datetime import datetime
 from enum import IntEnum
 import json
 import logging
+from operator import attrgetter
 import os
 import shutil
-from typing import List
+from typing import (List, Tuple)
 
 from bank.internal.statement import Statement
+from bank.utils.file_stamp import get_file_stamp
 
+# pylint: disable=too-many-instance-attributes
 class Account():
     """
     Account
@@ -19,6 +24,9 @@ class Account():
 
     CSV_KEY_LIST = ["id", "name"]
 
+    # Statement list sort key
+    STAT_KEY = attrgetter("date")
+
     class FieldIdx(IntEnum):
         """
         Field index
@@ -26,7 +34,8 @@ class Account():
 
         NAME = 0
 
-    def __init__(self, parent_dir: str, name: str = "") -> None:
+    def __init__(self, parent_dir: str, name: str = "",
+                 executor: Executor = None, manifest: dict = None) -> None:
 
         self.logger = logging.getLogger("Account")
 
@@ -35,14 +44,25 @@ class Account():
 
         self.dir: str = self.parent_dir + "/account_" + self.name
         self.stat_list: List[Statement] = []
-        self.file_sync: bool = True
+        # Balance index, parallel to statement list : sorted dates and end balances
+        # Updated on statement add, remove and update
+        self._stat_date_list: List[datetime] = []
+        self._stat_bal_list: List[int] = []
+        # Actual balance cache : (balance, valid until date), None if invalid
+        self._bal_cache: Tuple[int, datetime] = None
+        # Per file sync : only unsynced files are written
+        self.info_sync: bool = True
+        self.stat_list_sync: bool = True
+        # Folder left by rename, removed by parent on write, None if not renamed
+        self.dir_old: str = None
 
         self.logger.debug("parent_dir = %s", self.parent_dir)
         self.logger.debug("name = %s", self.name)
         self.logger.debug("dir = %s", self.dir)
 
-        self.logger.debug("Read dir")
-        self.read_dir()
+        if manifest is None or not self.read_manifest(manifest, executor):
+            self.logger.debug("Read dir")
+            self.read_dir(executor)
 
     def get_str(self, indent: int = 0) -> str:
         """
@@ -63,6 +83,20 @@ class Account():
 
         return ret
 
+    @property
+    def file_sync(self) -> bool:
+        """
+        Is account synced with folder
+        Statements sync not included
+        """
+
+        return self.info_sync and self.stat_list_sync
+
+    @file_sync.setter
+    def file_sync(self, file_sync: bool) -> None:
+        self.info_sync = file_sync
+        self.stat_list_sync = file_sync
+
     def get_stat(self, date: datetime) -> Statement:
         """
         Get statement by date
@@ -74,42 +108,146 @@ class Account():
 
         return None
 
-    def get_bal(self) -> float:
-        """Get actual balance
-        End balance of last statement"""
+    def get_stat_idx(self, stat: Statement) -> int:
+        """
+        Get statement index in list, by identity
+        Bisect on indexed date, then scan statements of same date
+        -1 if not found
+        """
 
-        date_max: datetime = None
-        stat_last: Statement = None
+        idx = bisect_left(self._stat_date_list, stat.date)
+        while idx < len(self.stat_list) and self._stat_date_list[idx] == stat.date:
+            if self.stat_list[idx] is stat:
+                return idx
+            idx += 1
 
-        for stat in self.stat_list:
-            if not date_max or stat.date > date_max and stat.date < datetime.now():
-                date_max = stat.date
-                stat_last = stat
+        # Date edited while in list : scan whole list
+        for (idx, stat_it) in enumerate(self.stat_list):
+            if stat_it is stat:
+                return idx
 
-        if stat_last is None:
-            return 0.0
+        return -1
 
-        return stat_last.bal_end
+    def search_stat(self, query: str) -> List[Statement]:
+        """
+        Search statements with operations matching query, see OpeIndex
+        Statement operation lists read and indexed on first search
+
+        Returns:
+            List[Statement]: Matching statements, None if no term
+        """
 
-    def get_bal_at(self, _date: datetime):
-        bal: float = 0.0
+        stat_list: List[Statement] = []
         for stat in self.stat_list:
-            if stat.date < _date:
-                bal = stat.bal_end
-            else:
-                break
+            ope_dict = stat.get_ope_index().search(query)
+            if ope_dict is None:
+                # No term : no filter
+                return None
+            if len(ope_dict) != 0:
+                stat_list.append(stat)
+
+        return stat_list
+
+    def _init_stat_index(self) -> None:
+        """
+        Init balance index from sorted statement list
+        """
+
+        self._stat_date_list = [stat.date for stat in self.stat_list]
+        self._stat_bal_list = [stat.bal_end for stat in self.stat_list]
+        self._bal_cache = None
+
+    def get_bal(self) -> int:
+        """Get actual balance
+        End balance of last statement before now, else of first statement"""
+
+        now = datetime.now()
+        if self._bal_cache is not None:
+            (bal, date_valid) = self._bal_cache
+            if date_valid is None or now < date_valid:
+                return bal
+
+        if len(self.stat_list) == 0:
+            return 0
+
+        idx = bisect_left(self._stat_date_list, now)
+
+        bal = self._stat_bal_list[max(idx - 1, 0)]
+        # Valid until next statement date is reached
+        date_valid = self._stat_date_list[idx] if idx < len(self._stat_date_list) else None
+        self._bal_cache = (bal, date_valid)
+
         return bal
 
-    def get_last_stat_date(self) -> datetime:
-        """Get last statement date"""
+    def get_bal_at(self, _date: datetime) -> int:
+        """Get balance at date
+        End balance of last statement before date"""
+
+        idx = bisect_left(self._stat_date_list, _date)
+        if idx == 0:
+            return 0
+
+        return self._stat_bal_list[idx - 1]
 
-        date_max: datetime = None
+    def get_bal_timeline(self) -> Tuple[List[datetime], List[int]]:
+        """Get balance timeline
+        Sorted statement dates and matching end balances, not to be modified"""
+
+        return (self._stat_date_list, self._stat_bal_list)
+
+    def get_ope_bal_series(self) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Get running balance after each operation, over all statements
+        Each statement restarts from its start balance
+        Loads all statements operation list
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Sorted dates (datetime64[us])
+                and balances in cents (int64)
+        """
+
+        # Only needed for plotting
+        import numpy as np # pylint: disable=import-outside-toplevel
+
+        date_list: List[datetime] = []
+        amount_list: List[int] = []
+        stat_start_list: List[int] = []
+        bal_start_list: List[int] = []
 
         for stat in self.stat_list:
-            if not date_max or stat.date > date_max:
-                date_max = stat.date
+            if stat.get_ope_nb() == 0:
+                continue
+            stat_start_list.append(len(amount_list))
+            bal_start_list.append(stat.bal_start)
+            for ope in stat.ope_list:
+                date_list.append(ope.date)
+                amount_list.append(ope.amount)
+
+        if len(amount_list) == 0:
+            return (np.array([], dtype="datetime64[us]"), np.array([], dtype=np.int64))
+
+        # Balance variation of each operation
+        # At statement start : gap between its start balance and previous running balance
+        delta_arr = np.array(amount_list, dtype=np.int64)
+        stat_start_arr = np.array(stat_start_list, dtype=np.intp)
+        ope_sum_arr = np.concatenate(([0], np.cumsum(delta_arr)))
+        bal_arr = np.concatenate(([0], np.array(bal_start_list, dtype=np.int64)))
+        delta_arr[stat_start_arr] += (bal_arr[1:] - bal_arr[:-1]
+                                      - np.diff(ope_sum_arr[stat_start_arr], prepend=0))
+
+        # Stable : statement order kept for same date
+        date_arr = np.array(date_list, dtype="datetime64[us]")
+        sort_arr = np.argsort(date_arr, kind="stable")
+
+        return (date_arr[sort_arr], np.cumsum(delta_arr[sort_arr]))
 
-        return date_max
+    def get_last_stat_date(self) -> datetime:
+        """Get last statement date"""
+
+        if len(self._stat_date_list) == 0:
+            return None
+
+        return self._stat_date_list[-1]
 
     def set_name(self, name: str) -> None:
         """
@@ -120,9 +258,21 @@ class Account():
             name (str): Name
         """
 
+        if self.dir_old is None:
+            self.dir_old = self.dir
+
         self.name = name
         self.dir: str = self.parent_dir + "/account_" + self.name
 
+        # Statements moved to new folder
+        for stat in self.stat_list:
+            # Read operation list from current folder before leaving it
+            _ = stat.ope_list
+            stat.parent_dir = self.dir
+            stat.dir = stat.parent_dir + "/stat_" + stat.name
+
+        self.info_sync = False
+
     def _read_info(self) -> None:
 
         file_name: str = self.dir + "/info.json"
@@ -140,7 +290,9 @@ class Account():
                 self.name = data["name"]
                 self.logger.info("name = %s", self.name)
 
-    def _read_stat_list(self) -> None:
+    def _read_stat_list(self, executor: Executor = None) -> None:
+
+        stat_init_list: List[Tuple[str, dict]] = []
 
         self.logger.debug("List dir %s", self.dir)
         for item in os.listdir(self.dir):
@@ -148,27 +300,45 @@ class Account():
             if os.path.isdir(self.dir + "/" + item) and "stat_" in item:
                 stat_name = item[len("stat_"):]
                 self.logger.debug("Found statement %s", stat_name)
+                stat_init_list.append((stat_name, None))
 
-                self.logger.debug("Init statement %s", stat_name)
-                stat = Statement(self.dir, stat_name)
-                self.logger.debug("Statement inited : %s", stat)
+        self._init_stat_list(stat_init_list, executor)
 
-                stat_inserted = False
-                for (stat_idx, stat_it) in enumerate(self.stat_list):
-                    if stat.date < stat_it.date:
-                        self.stat_list.insert(stat_idx, stat)
-                        stat_inserted = True
-                        break
-                if not stat_inserted:
-                    self.stat_list.append(stat)
+    def _init_stat_list(self, stat_init_list: List[Tuple[str, dict]],
+                        executor: Executor = None) -> None:
+
+        def init_stat(stat_init: Tuple[str, dict]) -> Statement:
+            (stat_name, stat_manifest) = stat_init
+            self.logger.debug("Init statement %s", stat_name)
+            return Statement(self.dir, stat_name, stat_manifest)
+
+        if executor is None:
+            stat_inited_list = map(init_stat, stat_init_list)
+        else:
+            # Results in submission order : same list as sequential read
+            stat_inited_list = executor.map(init_stat, stat_init_list)
+
+        for stat in stat_inited_list:
+            self.logger.debug("Statement inited : %s", stat)
+            self.stat_list.append(stat)
+
+        # Sort once, stable : listing order kept for same date
+        self.stat_list.sort(key=self.STAT_KEY)
 
-    def read_dir(self) -> None:
+        self._init_stat_index()
+
+    def read_dir(self, executor: Executor = None) -> None:
         """
         Read from folder
+
+        Args:
+            executor (Executor): Executor reading statements concurrently, None for sequential
         """
 
         if not os.path.isdir(self.dir):
             self.logger.debug("Folder %s does not exist", self.dir)
+            # Not written yet
+            self.file_sync = False
             return
 
         self.logger.debug("Read info")
@@ -176,11 +346,58 @@ class Account():
 
         self.stat_list.clear()
         self.logger.debug("Read statements list")
-        self._read_stat_list()
+        self._read_stat_list(executor)
 
         self.logger.debug("File sync")
         self.file_sync = True
 
+    def read_manifest(self, data: dict, executor: Executor = None) -> bool:
+        """
+        Read from manifest entry instead of folder
+        Statements with outdated manifest entry are read from folder
+
+        Args:
+            data (dict): Manifest entry, from get_manifest
+            executor (Executor): Executor reading statements concurrently, None for sequential
+
+        Returns:
+            bool: Is manifest entry up to date with folder, else nothing read
+        """
+
+        # Folder stamp changes when statement folders are added or removed
+        if (data.get("dir_stamp") != get_file_stamp(self.dir) or
+            data.get("info_stamp") != get_file_stamp(self.dir + "/info.json")):
+            self.logger.debug("Manifest outdated")
+            return False
+
+        self.name = data["name"]
+
+        self.stat_list.clear()
+        self.logger.debug("Read statements list from manifest")
+        self._init_stat_list([(stat_data["dir_name"], stat_data)
+                              for stat_data in data["stat_list"]], executor)
+
+        self.logger.debug("File sync")
+        self.file_sync = True
+
+        return True
+
+    def get_manifest(self, with_ope_list: bool = False) -> dict:
+        """
+        Get manifest entry : info, statements manifest entries and file stamps
+
+        Args:
+            with_ope_list (bool): Include statements operation list
+        """
+
+        return {
+            "dir_name" : os.path.basename(self.dir)[len("account_"):],
+            "name" : self.name,
+            "dir_stamp" : get_file_stamp(self.dir),
+            "info_stamp" : get_file_stamp(self.dir + "/info.json"),
+            "stat_list" : [stat.get_manifest(with_ope_list) for stat in self.stat_list],
+        }
+
     def _write_info(self) -> None:
 
         file_name: str = self.dir + "/info.json"
@@ -194,7 +411,21 @@ class Account():
             self.logger.debug("Dump JSON to %s", file_name)
             json.dump(data, file)
 
-    def _write_stat_list(self) -> None:
+    def _write_stat_list(self, dir_created: bool = False) -> None:
+
+        if self.stat_list_sync and all(stat.dir_old is None for stat in self.stat_list):
+            # No statement added, removed or renamed
+            self.logger.debug("Statements list synced")
+
+        else:
+            self._remove_stat_dir_list()
+
+        for stat in self.stat_list:
+            if dir_created or not stat.file_sync:
+                self.logger.debug("Write statement %s to folder", stat.name)
+                stat.write_dir()
+
+    def _remove_stat_dir_list(self) -> None:
 
         self.logger.debug("List dir %s", self.dir)
         for item in os.listdir(self.dir):
@@ -217,24 +448,27 @@ class Account():
                     self.logger.debug("Remove dir %s", item)
                     shutil.rmtree(self.dir + "/" + item)
 
-        for stat in self.stat_list:
-            self.logger.debug("Write statement %s to folder", stat.name)
-            stat.write_dir()
-
     def write_dir(self) -> None:
         """
         Write to folder
+        Only unsynced files are written
         """
 
+        dir_created = False
         if not os.path.isdir(self.dir):
             self.logger.debug("Create folder %s", self.dir)
             os.mkdir(self.dir)
+            dir_created = True
 
-        self.logger.debug("Write info")
-        self._write_info()
+        if dir_created or not self.info_sync:
+            self.logger.debug("Write info")
+            self._write_info()
 
         self.logger.debug("Write statements list")
-        self._write_stat_list()
+        self._write_stat_list(dir_created)
+
+        # Old folder removed by parent before write
+        self.dir_old = None
 
         self.logger.debug("File sync")
         self.file_sync = True
@@ -244,22 +478,68 @@ class Account():
         Add statement
         """
 
-        idx = 0
-        while idx < len(self.stat_list) and stat.date > self.stat_list[idx].date:
-            idx = idx + 1
+        # After statements of same date
+        idx = bisect_right(self._stat_date_list, stat.date)
 
         self.stat_list.insert(idx, stat)
+        self._stat_date_list.insert(idx, stat.date)
+        self._stat_bal_list.insert(idx, stat.bal_end)
+        self._bal_cache = None
+
+        self.stat_list_sync = False
+
+    def update_stat(self, stat: Statement) -> None:
+        """
+        Update statement after date or balance edit
+        Move statement to its sorted position and update balance index
+        """
+
+        idx = self.get_stat_idx(stat)
+        if idx < 0:
+            return
 
-        self.file_sync = False
+        del self.stat_list[idx]
+        del self._stat_date_list[idx]
+        del self._stat_bal_list[idx]
+
+        idx = bisect_right(self._stat_date_list, stat.date)
+
+        self.stat_list.insert(idx, stat)
+        self._stat_date_list.insert(idx, stat.date)
+        self._stat_bal_list.insert(idx, stat.bal_end)
+        self._bal_cache = None
 
     def remove_stat(self, stat: Statement) -> None:
         """
         Remove statement
         """
 
-        if stat not in self.stat_list:
+        idx = self.get_stat_idx(stat)
+        if idx < 0:
+            return
+
+        del self.stat_list[idx]
+        del self._stat_date_list[idx]
+        del self._stat_bal_list[idx]
+        self._bal_cache = None
+
+        self.stat_list_sync = False
+
+    def remove_stat_list(self, stat_list: List[Statement]) -> None:
+        """
+        Remove statement list
+        Single pass over account statement list
+        """
+
+        stat_id_set = {id(stat) for stat in stat_list}
+
+        stat_kept_list = [stat for stat in self.stat_list if id(stat) not in stat_id_set]
+
+        if len(stat_kept_list) == len(self.stat_list):
+            # None found
             return
 
-        self.stat_list.remove(stat)
+        self.stat_list[:] = stat_kept_list
+        self._init_stat_index()
 
-        self.file_sync = False
+        self.stat_list_sync = False
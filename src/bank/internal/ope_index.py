@@ -0,0 +1,213 @@
+"""
+Operation index
+Operations by word of text fields and by amount, for search
+"""
+
+from bisect import (bisect_left, bisect_right, insort)
+import re
+from typing import (Dict, List, Tuple)
+
+from bank.internal.operation import Operation
+from bank.utils.amount import amount_from_str
+
+# Word : letters, digits and underscore
+WORD_RE = re.compile(r"\w+")
+
+def get_word_set(text: str) -> set:
+    """
+    Get lower case words of text
+    """
+
+    return set(WORD_RE.findall(text.lower()))
+
+class OpeIndex():
+    """
+    Operation search index
+    Updated on operation add and remove : operation fields not to be edited while indexed
+
+    Query : terms separated by spaces, all matched
+    - "word" : word prefix in any text field
+    - "field:word" : word prefix in text field (mode, tier, cat, desc)
+    - "amount:min..max" : amount in range, bounds included and optional, like "amount:-50..-10"
+    - "amount:value" : amount equal to value
+    """
+
+    # Searched text fields
+    FIELD_LIST = ["mode", "tier", "cat", "desc"]
+
+    def __init__(self, ope_list: List[Operation] = None) -> None:
+
+        # Per field, word : operations with word in field, by id
+        self.word_dict: Dict[str, Dict[str, Dict[int, Operation]]] = {
+            field: {} for field in self.FIELD_LIST}
+        # Per field, sorted words : prefix search
+        self.word_list_dict: Dict[str, List[str]] = {field: [] for field in self.FIELD_LIST}
+
+        # Operations sorted by amount, and their amounts
+        self.amount_list: List[int] = []
+        self.amount_ope_list: List[Operation] = []
+
+        if ope_list is None:
+            return
+
+        # Sort once
+        for ope in ope_list:
+            for field in self.FIELD_LIST:
+                word_dict = self.word_dict[field]
+                for word in get_word_set(getattr(ope, field)):
+                    word_dict.setdefault(word, {})[id(ope)] = ope
+        for field in self.FIELD_LIST:
+            self.word_list_dict[field] = sorted(self.word_dict[field])
+
+        self.amount_ope_list = sorted(ope_list, key=lambda ope: ope.amount)
+        self.amount_list = [ope.amount for ope in self.amount_ope_list]
+
+    def add_ope(self, ope: Operation) -> None:
+        """
+        Add operation
+        """
+
+        for field in self.FIELD_LIST:
+            word_dict = self.word_dict[field]
+            for word in get_word_set(getattr(ope, field)):
+                if word not in word_dict:
+                    word_dict[word] = {}
+                    insort(self.word_list_dict[field], word)
+                word_dict[word][id(ope)] = ope
+
+        idx = bisect_right(self.amount_list, ope.amount)
+        self.amount_list.insert(idx, ope.amount)
+        self.amount_ope_list.insert(idx, ope)
+
+    def remove_ope(self, ope: Operation) -> None:
+        """
+        Remove operation, with same fields as when added
+        """
+
+        for field in self.FIELD_LIST:
+            word_dict = self.word_dict[field]
+            for word in get_word_set(getattr(ope, field)):
+                ope_dict = word_dict.get(word)
+                if ope_dict is None:
+                    continue
+                ope_dict.pop(id(ope), None)
+                if len(ope_dict) == 0:
+                    del word_dict[word]
+                    word_list = self.word_list_dict[field]
+                    del word_list[bisect_left(word_list, word)]
+
+        # Among operations of same amount, by identity
+        for idx in range(bisect_left(self.amount_list, ope.amount),
+                         bisect_right(self.amount_list, ope.amount)):
+            if self.amount_ope_list[idx] is ope:
+                del self.amount_list[idx]
+                del self.amount_ope_list[idx]
+                break
+
+    def _search_word(self, field: str, prefix: str) -> Dict[int, Operation]:
+        """
+        Search operations with word starting with prefix in field
+        """
+
+        word_dict = self.word_dict[field]
+        word_list = self.word_list_dict[field]
+
+        idx = bisect_left(word_list, prefix)
+        if idx < len(word_list) and word_list[idx] == prefix and (
+            idx + 1 == len(word_list) or not word_list[idx + 1].startswith(prefix)):
+            # Single word : no copy
+            return word_dict[prefix]
+
+        ope_dict: Dict[int, Operation] = {}
+        while idx < len(word_list) and word_list[idx].startswith(prefix):
+            ope_dict.update(word_dict[word_list[idx]])
+            idx += 1
+
+        return ope_dict
+
+    def _search_amount(self, amount_min: int, amount_max: int) -> Dict[int, Operation]:
+        """
+        Search operations with amount in [amount_min, amount_max], None bound for no limit
+        """
+
+        idx_start = 0 if amount_min is None else bisect_left(self.amount_list, amount_min)
+        idx_end = (len(self.amount_list) if amount_max is None
+                   else bisect_right(self.amount_list, amount_max))
+
+        return {id(ope): ope for ope in self.amount_ope_list[idx_start:idx_end]}
+
+    @staticmethod
+    def parse_amount_range(range_str: str) -> Tuple[int, int]:
+        """
+        Parse amount range (min, max) in cents, like "-50..-10", "100..", "12.30"
+        None bound for no limit
+
+        Raises:
+            ValueError: Not an amount range
+        """
+
+        if ".." not in range_str:
+            amount = amount_from_str(range_str)
+            return (amount, amount)
+
+        (min_str, max_str) = range_str.split("..", 1)
+        amount_min = amount_from_str(min_str) if min_str.strip() != "" else None
+        amount_max = amount_from_str(max_str) if max_str.strip() != "" else None
+
+        return (amount_min, amount_max)
+
+    def search(self, query: str) -> Dict[int, Operation]:
+        """
+        Search operations matching all query terms
+        Incomplete terms, like "amount:-" while typing, are ignored
+
+        Returns:
+            Dict[int, Operation]: Matching operations, by id, not to be modified
+                None if no term
+        """
+
+        result_list: List[Dict[int, Operation]] = []
+        amount_range_list: List[Tuple[int, int]] = []
+
+        for term in query.split():
+
+            (field, sep, value) = term.partition(":")
+
+            if sep != "" and field.lower() == "amount":
+                try:
+                    amount_range_list += [self.parse_amount_range(value)]
+                except ValueError:
+                    continue
+
+            elif sep != "" and field.lower() in self.FIELD_LIST:
+                for prefix in get_word_set(value):
+                    result_list += [self._search_word(field.lower(), prefix)]
+
+            else:
+                # Any text field
+                for prefix in get_word_set(term):
+                    ope_dict: Dict[int, Operation] = {}
+                    for field_it in self.FIELD_LIST:
+                        ope_dict.update(self._search_word(field_it, prefix))
+                    result_list += [ope_dict]
+
+        if len(result_list) == 0:
+            if len(amount_range_list) == 0:
+                # No term : no filter
+                return None
+            # Amount terms only : first one from sorted amounts
+            result_list = [self._search_amount(*amount_range_list.pop(0))]
+
+        # Intersect, from smallest
+        result_list.sort(key=len)
+        ope_dict = result_list[0]
+        for result in result_list[1:]:
+            ope_dict = {ope_id: ope for (ope_id, ope) in ope_dict.items() if ope_id in result}
+
+        # Amount terms checked on remaining operations
+        for (amount_min, amount_max) in amount_range_list:
+            ope_dict = {ope_id: ope for (ope_id, ope) in ope_dict.items()
+                        if (amount_min is None or ope.amount >= amount_min) and
+                           (amount_max is None or ope.amount <= amount_max)}
+
+        return ope_dict
@@ -6,12 +6,16 @@ from datetime import datetime
 from enum import IntEnum
 
 from bank.utils import FMT_DATE
+from bank.utils.amount import amount_to_str
 
 class Operation():
     """
     Operation
     """
 
+    # No per instance dict : operations are the bulk of wallet memory
+    __slots__ = ("date", "mode", "tier", "cat", "desc", "amount")
+
     CSV_KEY_LIST = ["date", "mode", "tier", "cat", "desc", "amount"]
 
     class FieldIdx(IntEnum):
@@ -29,19 +33,20 @@ class Operation():
 
     # pylint: disable=too-many-arguments
     def __init__(self, _date: datetime, mode: str,
-                 tier: str, cat: str, desc: str, amount: float) -> None:
+                 tier: str, cat: str, desc: str, amount: int) -> None:
 
         self.date = _date
         self.mode = mode
         self.tier = tier
         self.cat = cat
         self.desc = desc
+        # In cents
         self.amount = amount
 
     def __str__(self) -> str:
 
         return (f"{self.date.strftime(FMT_DATE)}, {self.mode}, {self.tier}, {self.cat}"
-                f"{self.desc}, {self.amount}")
+                f"{self.desc}, {amount_to_str(self.amount)}")
 
     def get_str(self, indent: int = 0) -> str:
         """
@@ -58,7 +63,7 @@ class Operation():
         ret += f"{indent_str}tier   : {self.tier}\n"
         ret += f"{indent_str}cat    : {self.cat}\n"
         ret += f"{indent_str}desc   : {self.desc}\n"
-        ret += f"{indent_str}amount : {self.amount}"
+        ret += f"{indent_str}amount : {amount_to_str(self.amount)}"
 
         return ret
 
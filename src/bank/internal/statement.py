@@ -2,16 +2,23 @@
 Statement
 """
 
+from bisect import (bisect_left, bisect_right)
 import csv
 from datetime import datetime
 from enum import IntEnum
 import json
 import logging
+from operator import attrgetter
 import os
+import sys
+import threading
 from typing import List
 
+from bank.internal.ope_index import OpeIndex
 from bank.internal.operation import Operation
-from bank.utils.my_date import FMT_DATE
+from bank.utils.amount import (amount_from_float, amount_from_str, amount_to_float, amount_to_str)
+from bank.utils.file_stamp import get_file_stamp
+from bank.utils.my_date import (FMT_DATE, parse_date)
 
 # pylint: disable=too-many-instance-attributes
 class Statement():
@@ -21,6 +28,9 @@ class Statement():
 
     CSV_KEY_LIST = ["id", "name", "date", "bal_start", "bal_end"]
 
+    # Operation list sort key
+    OPE_KEY = attrgetter("date")
+
     class FieldIdx(IntEnum):
         """
         Field index
@@ -32,7 +42,7 @@ class Statement():
         BAL_END = 3
         LAST = BAL_END
 
-    def __init__(self, parent_dir: str, name: str = "") -> None:
+    def __init__(self, parent_dir: str, name: str = "", manifest: dict = None) -> None:
 
         self.logger = logging.getLogger("Statement")
 
@@ -41,23 +51,101 @@ class Statement():
 
         self.dir: str = parent_dir + "/stat_" + self.name
         self.date: datetime = datetime.now()
+        # Balances and operations sum in cents
         self.bal_start: int = 0
         self.bal_end: int = 0
-        self.ope_list: List[Operation] = []
-        self.ope_sum: float = 0.0
-        self.file_sync: bool = True
+        # Operation list and sum, None until read from folder
+        # Read once under lock : statement may be accessed from several threads, like GUI
+        self._ope_list_lock = threading.Lock()
+        self._ope_list: List[Operation] = None
+        self._ope_sum: int = None
+        # Operation search index, None until first search
+        self._ope_index: OpeIndex = None
+        # Operation number, from manifest until operation list read
+        self._ope_nb: int = None
+        # Per file sync : only unsynced files are written
+        self.info_sync: bool = True
+        self.ope_list_sync: bool = True
+        # Folder left by rename, removed by parent on write, None if not renamed
+        self.dir_old: str = None
+        # Edit version, bumped on change : display cache invalidation
+        self.version: int = 0
 
         self.logger.debug("parent_dir = %s", self.parent_dir)
         self.logger.debug("name = %s", self.name)
         self.logger.debug("dir = %s", self.dir)
 
-        self.logger.debug("Read dir")
-        self.read_dir()
+        if manifest is None or not self.read_manifest(manifest):
+            self.logger.debug("Read dir")
+            self.read_dir()
 
     def __str__(self) -> str:
 
-        return (f"{self.name}, {self.date.strftime(FMT_DATE)}, {self.bal_start}, {self.bal_end},"
-                f"{self.ope_sum}")
+        # Dont force operation list read
+        ope_sum_str = amount_to_str(self._ope_sum) if self._ope_sum is not None else "None"
+        return (f"{self.name}, {self.date.strftime(FMT_DATE)}, {amount_to_str(self.bal_start)}, "
+                f"{amount_to_str(self.bal_end)}, {ope_sum_str}")
+
+    @property
+    def ope_list(self) -> List[Operation]:
+        """
+        Operation list
+        Read from folder on first access
+        """
+
+        if self._ope_list is None:
+            with self._ope_list_lock:
+                if self._ope_list is None:
+                    self.logger.debug("Read operations list")
+                    self._read_ope_list()
+
+        return self._ope_list
+
+    @property
+    def ope_sum(self) -> int:
+        """
+        Operations sum
+        Read from folder on first access
+        """
+
+        if self._ope_sum is None:
+            with self._ope_list_lock:
+                if self._ope_sum is None:
+                    self.logger.debug("Read operations list")
+                    self._read_ope_list()
+
+        return self._ope_sum
+
+    @property
+    def file_sync(self) -> bool:
+        """
+        Is statement synced with folder
+        """
+
+        return self.info_sync and self.ope_list_sync
+
+    @file_sync.setter
+    def file_sync(self, file_sync: bool) -> None:
+        self.info_sync = file_sync
+        self.ope_list_sync = file_sync
+
+    def is_ope_list_loaded(self) -> bool:
+        """
+        Is operation list read from folder
+        """
+
+        return self._ope_list is not None
+
+    def get_ope_nb(self) -> int:
+        """
+        Get operation number
+        Operation list not read if number known from manifest
+        """
+
+        if self._ope_list is None and self._ope_nb is not None:
+            return self._ope_nb
+
+        return len(self.ope_list)
 
     def get_str(self, indent: int = 0) -> str:
         """
@@ -70,9 +158,10 @@ class Statement():
 
         ret = ""
         ret += f"{indent_str}date : {self.date.strftime(FMT_DATE)}\n"
-        ret += f"{indent_str}balance : [{str(self.bal_start)}, {str(self.bal_end)}]\n"
-        ret += f"{indent_str}operations sum : {str(self.ope_sum)}\n"
-        ret += f"{indent_str}balance diff : {str(self.ope_sum - self.bal_end)}\n"
+        ret += (f"{indent_str}balance : [{amount_to_str(self.bal_start)}, "
+                f"{amount_to_str(self.bal_end)}]\n")
+        ret += f"{indent_str}operations sum : {amount_to_str(self.ope_sum)}\n"
+        ret += f"{indent_str}balance diff : {amount_to_str(self.ope_sum - self.bal_end)}\n"
         ret += f"{indent_str}operations : [\n"
         for operation in self.ope_list:
             ret += f"{indent_str}    {{\n"
@@ -82,6 +171,54 @@ class Statement():
 
         return ret
 
+    def get_ope_idx(self, ope: Operation) -> int:
+        """
+        Get operation index in list, by identity
+        Bisect on date, then scan operations of same date
+        -1 if not found
+        """
+
+        ope_list = self.ope_list
+
+        idx = bisect_left(ope_list, ope.date, key=self.OPE_KEY)
+        while idx < len(ope_list) and ope_list[idx].date == ope.date:
+            if ope_list[idx] is ope:
+                return idx
+            idx += 1
+
+        # Date edited while in list : scan whole list
+        for (idx, ope_it) in enumerate(ope_list):
+            if ope_it is ope:
+                return idx
+
+        return -1
+
+    def get_ope_index(self) -> OpeIndex:
+        """
+        Get operation search index, built on first call
+        """
+
+        if self._ope_index is None:
+            self._ope_index = OpeIndex(self.ope_list)
+
+        return self._ope_index
+
+    def search_ope(self, query: str) -> List[Operation]:
+        """
+        Search operations matching query, see OpeIndex
+
+        Returns:
+            List[Operation]: Matching operations, in statement order
+                None if no term
+        """
+
+        ope_dict = self.get_ope_index().search(query)
+        if ope_dict is None:
+            return None
+
+        # Matching operations only, ordered by index in statement
+        return sorted(ope_dict.values(), key=self.get_ope_idx)
+
     def get_closest_ope(self, ope_list: List[Operation]) -> Operation:
         """
         Get closest operation from list
@@ -123,9 +260,18 @@ class Statement():
             name (str): Name
         """
 
+        # Read operation list from current folder before leaving it
+        _ = self.ope_list
+
+        if self.dir_old is None:
+            self.dir_old = self.dir
+
         self.name = name
         self.dir: str = self.parent_dir + "/stat_" + self.name
 
+        # New folder : all files to write
+        self.file_sync = False
+
     def _read_info(self) -> None:
 
         file_name: str = self.dir + "/info.json"
@@ -146,67 +292,142 @@ class Statement():
                 self.date = datetime.strptime(data["date"], FMT_DATE)
                 self.logger.info("date = %s", self.date.strftime(FMT_DATE))
             if "bal_start" in data:
-                self.bal_start = data["bal_start"]
-                self.logger.info("bal_start = %s", self.bal_start)
+                self.bal_start = amount_from_float(data["bal_start"])
+                self.logger.info("bal_start = %s", amount_to_str(self.bal_start))
             if "bal_end" in data:
-                self.bal_end = data["bal_end"]
-                self.logger.info("bal_end = %s", self.bal_end)
+                self.bal_end = amount_from_float(data["bal_end"])
+                self.logger.info("bal_end = %s", amount_to_str(self.bal_end))
 
     def _read_ope_list(self) -> None:
 
+        # Built apart, then set at once : never seen partly read
+        ope_list: List[Operation] = []
+        ope_sum = 0
+
         file_name: str = self.dir + "/ope_list.csv"
 
         if not os.path.exists(file_name):
             self.logger.debug("File %s does not exist", file_name)
-            return
 
-        self.logger.debug("Open %s for reading", file_name)
-        with open(file_name, "r", encoding="utf8") as file:
-
-            reader = csv.DictReader(file)
+        else:
+            self.logger.debug("Open %s for reading", file_name)
+            with open(file_name, "r", encoding="utf8") as file:
 
-            self.ope_list.clear()
-            self.ope_sum = 0.0
+                reader = csv.DictReader(file)
 
-            for row in reader:
+                for row in reader:
 
-                self.logger.debug("Init operation")
-                ope = Operation(datetime.strptime(row["date"], FMT_DATE), row["mode"],
-                                row["tier"], row["cat"], row["desc"], float(row["amount"]))
-                self.logger.debug("Operation inited : %s", ope)
+                    self.logger.debug("Init operation")
+                    # Share repeated date and field values between operations
+                    ope = Operation(parse_date(row["date"]), sys.intern(row["mode"]),
+                                    sys.intern(row["tier"]), sys.intern(row["cat"]), row["desc"],
+                                    amount_from_str(row["amount"]))
+                    self.logger.debug("Operation inited : %s", ope)
 
-                ope_inserted = False
-                for (ope_idx, ope_it) in enumerate(self.ope_list):
-                    if ope.date < ope_it.date:
-                        self.ope_list.insert(ope_idx, ope)
-                        ope_inserted = True
-                        break
-                if not ope_inserted:
-                    self.ope_list.append(ope)
+                    ope_list.append(ope)
+                    ope_sum += ope.amount
 
-                self.ope_sum += ope.amount
+            # Sort once, stable : file order kept for same date
+            ope_list.sort(key=self.OPE_KEY)
 
-            self.file_sync = True
+        self._ope_index = None
+        self._ope_nb = None
+        self._ope_sum = ope_sum
+        self._ope_list = ope_list
 
     def read_dir(self) -> None:
         """
         Read from folder
+        Operation list is read on first access
         """
 
         if not os.path.isdir(self.dir):
             self.logger.debug("Folder %s does not exist", self.dir)
+            # Not written yet
+            self.file_sync = False
             return
 
         self.logger.debug("Read info")
         self._read_info()
 
-        self.ope_list.clear()
-        self.logger.debug("Read operations list")
-        self._read_ope_list()
+        self.logger.debug("Defer operations list read")
+        self._ope_list = None
+        self._ope_index = None
+        self._ope_sum = None
+        self._ope_nb = None
+        self.version += 1
+
+        self.logger.debug("File sync")
+        self.file_sync = True
+
+    def read_manifest(self, data: dict) -> bool:
+        """
+        Read from manifest entry instead of folder
+        Operation list taken from entry if included, else read on first access
+
+        Args:
+            data (dict): Manifest entry, from get_manifest
+
+        Returns:
+            bool: Is manifest entry up to date with folder, else nothing read
+        """
+
+        if (data.get("info_stamp") != get_file_stamp(self.dir + "/info.json") or
+            data.get("ope_list_stamp") != get_file_stamp(self.dir + "/ope_list.csv")):
+            self.logger.debug("Manifest outdated")
+            return False
+
+        self.name = data["name"]
+        self.date = datetime.strptime(data["date"], FMT_DATE)
+        self.bal_start = data["bal_start"]
+        self.bal_end = data["bal_end"]
+
+        self._ope_list = None
+        self._ope_index = None
+        self._ope_sum = data["ope_sum"]
+        self._ope_nb = data["ope_nb"]
+
+        if "ope_list" in data:
+            self._ope_list = [Operation(*ope_row) for ope_row in data["ope_list"]]
 
         self.logger.debug("File sync")
         self.file_sync = True
 
+        return True
+
+    def get_manifest(self, with_ope_list: bool = False) -> dict:
+        """
+        Get manifest entry : info, operation list summary and file stamps
+        Operation list not read unless included
+
+        Args:
+            with_ope_list (bool): Include operation list, as rows of operation fields
+        """
+
+        if with_ope_list:
+            data = self.get_manifest()
+            data["ope_nb"] = len(self.ope_list)
+            data["ope_sum"] = self.ope_sum
+            data["ope_list"] = [(ope.date, ope.mode, ope.tier, ope.cat, ope.desc, ope.amount)
+                                for ope in self.ope_list]
+            return data
+
+        ope_nb = self._ope_nb
+        if self._ope_list is not None:
+            ope_nb = len(self._ope_list)
+
+        return {
+            "dir_name" : os.path.basename(self.dir)[len("stat_"):],
+            "name" : self.name,
+            "date" : self.date.strftime(FMT_DATE),
+            "bal_start" : self.bal_start,
+            "bal_end" : self.bal_end,
+            "ope_nb" : ope_nb,
+            "ope_sum" : self._ope_sum,
+            "info_stamp" : get_file_stamp(self.dir + "/info.json"),
+            "ope_list_stamp" : get_file_stamp(self.dir + "/ope_list.csv"),
+        }
+
     def _write_info(self) -> None:
 
         file_name: str = self.dir + "/info.json"
@@ -216,8 +437,8 @@ class Statement():
             data = {
                 "name" : self.name,
                 "date" : self.date.strftime(FMT_DATE),
-                "bal_start" : self.bal_start,
-                "bal_end" : self.bal_end,
+                "bal_start" : amount_to_float(self.bal_start),
+                "bal_end" : amount_to_float(self.bal_end),
             }
 
             self.logger.debug("Dump JSON to %s", file_name)
@@ -242,7 +463,7 @@ class Statement():
                     "tier": ope.tier,
                     "cat": ope.cat,
                     "desc": ope.desc,
-                    "amount": ope.amount,
+                    "amount": amount_to_str(ope.amount),
                 }
 
                 self.logger.debug("Write row to %s", file_name)
@@ -251,17 +472,26 @@ class Statement():
     def write_dir(self) -> None:
         """
         Write to folder
+        Only unsynced files are written
         """
 
+        dir_created = False
         if not os.path.isdir(self.dir):
             self.logger.debug("Create folder %s", self.dir)
             os.mkdir(self.dir)
+            dir_created = True
+
+        if dir_created or not self.info_sync:
+            self.logger.debug("Write info")
+            self._write_info()
 
-        self.logger.debug("Write info")
-        self._write_info()
+        # Operation list not read : file content unchanged
+        if dir_created or (not self.ope_list_sync and self.is_ope_list_loaded()):
+            self.logger.debug("Write operations list")
+            self._write_ope_list()
 
-        self.logger.debug("Write operations list")
-        self._write_ope_list()
+        # Old folder removed by parent before write
+        self.dir_old = None
 
         self.logger.debug("File sync")
         self.file_sync = True
@@ -271,40 +501,76 @@ class Statement():
         Add operation
         """
 
-        idx = 0
-        while idx < len(self.ope_list) and ope.date > self.ope_list[idx].date:
-            idx = idx + 1
+        # After operations of same date
+        idx = bisect_right(self.ope_list, ope.date, key=self.OPE_KEY)
 
         self.ope_list.insert(idx, ope)
-        self.ope_sum += ope.amount
+        self._ope_sum += ope.amount
+        if self._ope_index is not None:
+            self._ope_index.add_ope(ope)
+        self.version += 1
 
-        self.file_sync = False
+        self.ope_list_sync = False
 
     def add_ope_list(self, ope_list: List[Operation]) -> None:
         """
         Add operation list
         """
 
+        if len(ope_list) == 0:
+            return
+
+        # Append and sort once, stable : same order as adding one by one
+        self.ope_list.extend(ope_list)
+        self.ope_list.sort(key=self.OPE_KEY)
+
         for ope in ope_list:
-            self.add_ope(ope)
+            self._ope_sum += ope.amount
+            if self._ope_index is not None:
+                self._ope_index.add_ope(ope)
+        self.version += 1
+
+        self.ope_list_sync = False
 
     def remove_ope(self, ope: Operation) -> None:
         """
         Remove operation
         """
 
-        if ope not in self.ope_list:
+        idx = self.get_ope_idx(ope)
+        if idx < 0:
             return
 
-        self.ope_list.remove(ope)
-        self.ope_sum -= ope.amount
+        del self.ope_list[idx]
+        self._ope_sum -= ope.amount
+        if self._ope_index is not None:
+            self._ope_index.remove_ope(ope)
+        self.version += 1
 
-        self.file_sync = False
+        self.ope_list_sync = False
 
     def remove_ope_list(self, ope_list: List[Operation]) -> None:
         """
         Remove operation list
+        Single pass over statement operation list
         """
 
-        for ope in ope_list:
-            self.remove_ope(ope)
+        ope_id_set = {id(ope) for ope in ope_list}
+
+        ope_kept_list: List[Operation] = []
+        for ope in self.ope_list:
+            if id(ope) in ope_id_set:
+                self._ope_sum -= ope.amount
+                if self._ope_index is not None:
+                    self._ope_index.remove_ope(ope)
+            else:
+                ope_kept_list.append(ope)
+
+        if len(ope_kept_list) == len(self.ope_list):
+            # None found
+            return
+
+        self.ope_list[:] = ope_kept_list
+        self.version += 1
+
+        self.ope_list_sync = False
@@ -2,13 +2,17 @@
 Wallet, list of accounts
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 import json
 import logging
 import os
+import pickle
 import shutil
-from typing import List
+from typing import (Callable, List, Tuple)
 
 from bank.internal.account import Account
+from bank.utils.file_stamp import get_file_stamp
 
 class Wallet():
     """
@@ -17,20 +21,37 @@ class Wallet():
 
     CSV_KEY_LIST = ["id", "name"]
 
-    def __init__(self, parent_dir: str, name: str = "") -> None:
+    # Manifest format version, manifest ignored on mismatch
+    MANIFEST_VERSION = 2
+
+    # Snapshot format version, snapshot ignored on mismatch
+    SNAPSHOT_VERSION = 2
+
+    def __init__(self, parent_dir: str, name: str = "", jobs: int = 1,
+                 cache: bool = False, account_cb: Callable[[Account], None] = None) -> None:
 
         self.logger = logging.getLogger("Wallet")
 
         self.parent_dir: str = parent_dir
         self.name: str = name
+        # Number of workers reading accounts and statements concurrently
+        self.jobs: int = jobs
+        # Use snapshot cache, next to wallet folder
+        self.cache: bool = cache
+        # Called with each account once read, in list order, from reading thread
+        self.account_cb: Callable[[Account], None] = account_cb
 
         self.dir: str = self.parent_dir + "/wallet_" + self.name
         self.account_list: List[Account] = []
-        self.file_sync: bool = True
+        # Per file sync : only unsynced files are written
+        self.info_sync: bool = True
+        self.account_list_sync: bool = True
 
         self.logger.debug("parent_dir = %s", self.parent_dir)
         self.logger.debug("name = %s", self.name)
         self.logger.debug("dir = %s", self.dir)
+        self.logger.debug("jobs = %s", self.jobs)
+        self.logger.debug("cache = %s", self.cache)
 
         self.logger.debug("Read dir")
         self.read_dir()
@@ -54,6 +75,20 @@ class Wallet():
 
         return ret
 
+    @property
+    def file_sync(self) -> bool:
+        """
+        Is wallet synced with folder
+        Accounts sync not included
+        """
+
+        return self.info_sync and self.account_list_sync
+
+    @file_sync.setter
+    def file_sync(self, file_sync: bool) -> None:
+        self.info_sync = file_sync
+        self.account_list_sync = file_sync
+
     def get_account(self, name: str) -> Account:
         """
         Get statement by date
@@ -65,17 +100,85 @@ class Wallet():
 
         return None
 
-    def get_bal(self) -> float:
+    def get_bal(self) -> int:
         """Get balance
         Sum of account balance"""
 
-        balance: float = 0
+        balance: int = 0
 
         for account in self.account_list:
             balance += account.get_bal()
 
         return balance
 
+    def get_bal_matrix(self, date_list: List[datetime],
+                       account_list: List[Account] = None) -> "numpy.ndarray":
+        """
+        Get balance matrix : balance of each account at each date
+        One sorted search per account over its balance timeline
+
+        Args:
+            date_list (List[datetime]): Dates
+            account_list (List[Account]): Accounts, None for all wallet accounts
+
+        Returns:
+            numpy.ndarray: Balance in cents, int64, shape (accounts, dates)
+        """
+
+        # Only needed for plotting
+        import numpy as np # pylint: disable=import-outside-toplevel
+
+        if account_list is None:
+            account_list = self.account_list
+
+        date_arr = np.array(date_list, dtype="datetime64[us]")
+        bal_matrix = np.zeros((len(account_list), len(date_arr)), dtype=np.int64)
+
+        for (account_idx, account) in enumerate(account_list):
+            (stat_date_list, stat_bal_list) = account.get_bal_timeline()
+            if len(stat_date_list) == 0:
+                continue
+            stat_date_arr = np.array(stat_date_list, dtype="datetime64[us]")
+            # Leading 0 : balance before first statement
+            stat_bal_arr = np.concatenate(([0], np.array(stat_bal_list, dtype=np.int64)))
+            # Index of last statement strictly before date, plus 1
+            stat_idx_arr = np.searchsorted(stat_date_arr, date_arr, side="left")
+            bal_matrix[account_idx] = stat_bal_arr[stat_idx_arr]
+
+        return bal_matrix
+
+    def get_ope_bal_series(self, account_list: List[Account] = None
+                           ) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Get total running balance after each operation, across accounts
+        Merge of account running balances, see Account.get_ope_bal_series
+
+        Args:
+            account_list (List[Account]): Accounts, None for all wallet accounts
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Sorted dates (datetime64[us])
+                and balances in cents (int64)
+        """
+
+        # Only needed for plotting
+        import numpy as np # pylint: disable=import-outside-toplevel
+
+        if account_list is None:
+            account_list = self.account_list
+
+        date_arr_list = [np.array([], dtype="datetime64[us]")]
+        delta_arr_list = [np.array([], dtype=np.int64)]
+        for account in account_list:
+            (date_arr, bal_arr) = account.get_ope_bal_series()
+            date_arr_list.append(date_arr)
+            delta_arr_list.append(np.diff(bal_arr, prepend=0))
+
+        date_arr = np.concatenate(date_arr_list)
+        sort_arr = np.argsort(date_arr, kind="stable")
+
+        return (date_arr[sort_arr], np.cumsum(np.concatenate(delta_arr_list)[sort_arr]))
+
     def set_name(self, name: str) -> None:
         """
         Set name
@@ -88,6 +191,8 @@ class Wallet():
         self.name = name
         self.dir: str = self.parent_dir + "/wallet_" + self.name
 
+        self.info_sync = False
+
     def _read_info(self) -> None:
 
         file_name: str = self.dir + "/info.json"
@@ -105,20 +210,108 @@ class Wallet():
                 self.name = data["name"]
                 self.logger.info("name = %s", self.name)
 
+    def _read_manifest(self) -> bool:
+
+        file_name: str = self.dir + "/manifest.json"
+
+        if not os.path.exists(file_name):
+            self.logger.debug("File %s does not exist", file_name)
+            return False
+
+        self.logger.debug("Open %s for reading", file_name)
+        with open(file_name, "r", encoding="utf8") as file:
+
+            try:
+                data = json.load(file)
+            except ValueError:
+                self.logger.warning("File %s invalid", file_name)
+                return False
+
+        if data.get("version") != self.MANIFEST_VERSION:
+            self.logger.debug("Manifest version mismatch")
+            return False
+
+        return self._read_manifest_data(data)
+
+    def _read_snapshot(self) -> bool:
+
+        file_name: str = self.dir + ".cache"
+
+        if not os.path.exists(file_name):
+            self.logger.debug("File %s does not exist", file_name)
+            return False
+
+        self.logger.debug("Open %s for reading", file_name)
+        with open(file_name, "rb") as file:
+
+            try:
+                data = pickle.load(file)
+            except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+                self.logger.warning("File %s invalid", file_name)
+                return False
+
+        if not isinstance(data, dict) or data.get("version") != self.SNAPSHOT_VERSION:
+            self.logger.debug("Snapshot version mismatch")
+            return False
+
+        return self._read_manifest_data(data)
+
+    def _read_manifest_data(self, data: dict) -> bool:
+
+        # Folder stamp changes when account folders are added or removed
+        if data.get("dir_stamp") != get_file_stamp(self.dir):
+            self.logger.debug("Manifest outdated")
+            return False
+
+        self.logger.debug("Read account list from manifest")
+        self._init_account_list([(account_data["dir_name"], account_data)
+                                 for account_data in data["account_list"]])
+
+        return True
+
     def _read_account_list(self) -> None:
 
+        account_init_list: List[Tuple[str, dict]] = []
+
         self.logger.debug("List dir %s", self.dir)
         for item in os.listdir(self.dir):
 
             if os.path.isdir(self.dir + "/" + item) and "account_" in item:
                 account_name = item[len("account_"):]
                 self.logger.debug("Found account %s", account_name)
+                account_init_list.append((account_name, None))
 
+        self._init_account_list(account_init_list)
+
+    def _init_account_list(self, account_init_list: List[Tuple[str, dict]]) -> None:
+
+        if self.jobs <= 1:
+
+            for (account_name, account_manifest) in account_init_list:
                 self.logger.debug("Init account %s", account_name)
-                stat = Account(self.dir, account_name)
-                self.logger.debug("Account inited : %s", stat)
+                account = Account(self.dir, account_name, manifest=account_manifest)
+                self.logger.debug("Account inited : %s", account)
+                self.account_list.append(account)
+                if self.account_cb is not None:
+                    self.account_cb(account)
 
-                self.account_list.append(stat)
+            return
+
+        # Separate pools : account workers wait on statement workers, never the other way
+        with ThreadPoolExecutor(self.jobs) as account_executor, \
+             ThreadPoolExecutor(self.jobs) as stat_executor:
+
+            def init_account(account_init: Tuple[str, dict]) -> Account:
+                (account_name, account_manifest) = account_init
+                self.logger.debug("Init account %s", account_name)
+                return Account(self.dir, account_name, stat_executor, account_manifest)
+
+            # Results in submission order : same list as sequential read
+            for account in account_executor.map(init_account, account_init_list):
+                self.logger.debug("Account inited : %s", account)
+                self.account_list.append(account)
+                if self.account_cb is not None:
+                    self.account_cb(account)
 
     def read_dir(self) -> None:
         """
@@ -127,14 +320,27 @@ class Wallet():
 
         if not os.path.isdir(self.dir):
             self.logger.debug("Folder %s does not exist", self.dir)
+            # Not written yet
+            self.file_sync = False
             return
 
         self.logger.debug("Read info")
         self._read_info()
 
         self.account_list.clear()
-        self.logger.debug("Read account list")
-        self._read_account_list()
+        if self.cache and self._read_snapshot():
+            self.logger.debug("Read from snapshot")
+        elif self._read_manifest():
+            self.logger.debug("Read from manifest")
+        else:
+            self.logger.debug("Read account list")
+            self._read_account_list()
+
+        # Statements not taken from snapshot are read from folder
+        if self.cache and not all(stat.is_ope_list_loaded()
+                                  for account in self.account_list for stat in account.stat_list):
+            self.logger.debug("Write snapshot")
+            self._write_snapshot()
 
         self.logger.debug("File sync")
         self.file_sync = True
@@ -154,6 +360,21 @@ class Wallet():
 
     def _write_account_list(self) -> None:
 
+        if self.account_list_sync and all(account.dir_old is None
+                                          for account in self.account_list):
+            # No account added, removed or renamed
+            self.logger.debug("Accounts list synced")
+
+        else:
+            self._remove_account_dir_list()
+
+        for account in self.account_list:
+            # Only unsynced account files are written
+            self.logger.debug("Write account %s to folder", account.name)
+            account.write_dir()
+
+    def _remove_account_dir_list(self) -> None:
+
         self.logger.debug("List dir %s", self.dir)
         for item in os.listdir(self.dir):
 
@@ -175,25 +396,76 @@ class Wallet():
                     self.logger.debug("Remove dir %s", item)
                     shutil.rmtree(self.dir + "/" + item)
 
-        for account in self.account_list:
-            self.logger.debug("Write account %s to folder", account.name)
-            account.write_dir()
+    def _write_manifest(self) -> None:
+
+        file_name: str = self.dir + "/manifest.json"
+
+        if not os.path.exists(file_name):
+            # Create first : folder stamp must not change once taken
+            self.logger.debug("Create %s", file_name)
+            with open(file_name, "w", encoding="utf8"):
+                pass
+
+        data = {
+            "version" : self.MANIFEST_VERSION,
+            "dir_stamp" : get_file_stamp(self.dir),
+            "account_list" : [account.get_manifest() for account in self.account_list],
+        }
+
+        self.logger.debug("Open %s for writing", file_name)
+        with open(file_name, "w", encoding="utf8") as file:
+
+            self.logger.debug("Dump JSON to %s", file_name)
+            json.dump(data, file)
+
+    def _write_snapshot(self) -> None:
+
+        file_name: str = self.dir + ".cache"
+        file_name_tmp: str = file_name + ".tmp"
+
+        data = {
+            "version" : self.SNAPSHOT_VERSION,
+            "dir_stamp" : get_file_stamp(self.dir),
+            "account_list" : [account.get_manifest(with_ope_list=True)
+                              for account in self.account_list],
+        }
+
+        # Replace at once : never leave a partly written snapshot
+        self.logger.debug("Open %s for writing", file_name_tmp)
+        with open(file_name_tmp, "wb") as file:
+
+            self.logger.debug("Dump pickle to %s", file_name_tmp)
+            pickle.dump(data, file, pickle.HIGHEST_PROTOCOL)
+
+        self.logger.debug("Replace %s", file_name)
+        os.replace(file_name_tmp, file_name)
 
     def write_dir(self) -> None:
         """
         Write to folder
+        Only unsynced files are written
         """
 
+        dir_created = False
         if not os.path.isdir(self.dir):
             self.logger.debug("Create folder %s", self.dir)
             os.mkdir(self.dir)
+            dir_created = True
 
-        self.logger.debug("Write info")
-        self._write_info()
+        if dir_created or not self.info_sync:
+            self.logger.debug("Write info")
+            self._write_info()
 
         self.logger.debug("Write accounts list")
         self._write_account_list()
 
+        self.logger.debug("Write manifest")
+        self._write_manifest()
+
+        if self.cache:
+            self.logger.debug("Write snapshot")
+            self._write_snapshot()
+
         self.logger.debug("File sync")
         self.file_sync = True
 
@@ -208,16 +480,35 @@ class Wallet():
 
         self.account_list.insert(idx, account)
 
-        self.file_sync = False
+        self.account_list_sync = False
 
     def remove_stat(self, account: Account) -> None:
         """
         Remove account
         """
 
-        if account not in self.account_list:
+        # By identity
+        for (idx, account_it) in enumerate(self.account_list):
+            if account_it is account:
+                del self.account_list[idx]
+                self.account_list_sync = False
+                return
+
+    def remove_stat_list(self, account_list: List[Account]) -> None:
+        """
+        Remove account list
+        Single pass over wallet account list
+        """
+
+        account_id_set = {id(account) for account in account_list}
+
+        account_kept_list = [account for account in self.account_list
+                             if id(account) not in account_id_set]
+
+        if len(account_kept_list) == len(self.account_list):
+            # None found
             return
 
-        self.account_list.remove(account)
+        self.account_list[:] = account_kept_list
 
-        self.file_sync = False
+        self.account_list_sync = False
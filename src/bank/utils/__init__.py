@@ -2,6 +2,9 @@
 bank/utils init
 """
 
+from .amount import (amount_from_float, amount_from_str, amount_to_float, amount_to_str)
 from .clipboard import Clipboard
-from .my_date import (FMT_DATE, get_next_month)
+from .downsample import downsample_min_max
+from .file_stamp import get_file_stamp
+from .my_date import (FMT_DATE, get_next_month, parse_date)
 from .return_code import RetCode
@@ -0,0 +1,43 @@
+"""
+Amount
+Stored as integer number of cents : exact sums
+"""
+
+from decimal import (Decimal, InvalidOperation, ROUND_HALF_UP)
+
+def amount_from_str(amount_str: str) -> int:
+    """
+    Parse amount in cents from decimal string, like "-12.3"
+
+    Raises:
+        ValueError: Not a decimal string
+    """
+
+    try:
+        return int((Decimal(amount_str.strip()) * 100).quantize(Decimal(1), ROUND_HALF_UP))
+    except (InvalidOperation, ValueError) as exc:
+        raise ValueError(f"invalid amount {amount_str!r}") from exc
+
+def amount_from_float(amount: float) -> int:
+    """
+    Get amount in cents from float number of units, like JSON value
+    """
+
+    return round(amount * 100)
+
+def amount_to_float(amount: int) -> float:
+    """
+    Get float number of units from amount in cents, like JSON value
+    """
+
+    return amount / 100
+
+def amount_to_str(amount: int) -> str:
+    """
+    Format amount in cents to decimal string with 2 decimals, like "-12.30"
+    """
+
+    sign = "-" if amount < 0 else ""
+    (units, cents) = divmod(abs(amount), 100)
+
+    return f"{sign}{units}.{cents:02d}"
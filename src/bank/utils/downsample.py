@@ -0,0 +1,54 @@
+"""
+Downsample
+Series reduction for plotting, keeping bucket min and max
+"""
+
+from typing import Tuple
+
+def downsample_min_max(x_arr: "numpy.ndarray", y_arr: "numpy.ndarray",
+                       x_min: float, x_max: float,
+                       bucket_nb: int) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    """
+    Downsample series visible in [x_min, x_max] to at most 2 points per bucket
+    Bucket min and max points are kept : peaks are preserved at any zoom level
+    Closest points outside range are kept : line reaches the axis edges
+
+    Args:
+        x_arr (numpy.ndarray): Sorted x values
+        y_arr (numpy.ndarray): y values
+        x_min (float): Visible range start
+        x_max (float): Visible range end
+        bucket_nb (int): Number of buckets, like the axis width in pixels
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Downsampled (x, y)
+    """
+
+    # Only needed for plotting
+    import numpy as np # pylint: disable=import-outside-toplevel
+
+    idx_start = max(np.searchsorted(x_arr, x_min, side="left") - 1, 0)
+    idx_end = min(np.searchsorted(x_arr, x_max, side="right") + 1, len(x_arr))
+
+    x_vis = x_arr[idx_start:idx_end]
+    y_vis = y_arr[idx_start:idx_end]
+
+    bucket_nb = max(bucket_nb, 1)
+    if len(x_vis) <= 2 * bucket_nb:
+        return (x_vis, y_vis)
+
+    # Equal count buckets, last partial bucket padded with its last value
+    bucket_len = -(-len(y_vis) // bucket_nb)
+    pad_len = bucket_nb * bucket_len - len(y_vis)
+    y_bucket = np.concatenate((y_vis, np.full(pad_len, y_vis[-1]))).reshape(bucket_nb, bucket_len)
+
+    bucket_start_arr = np.arange(bucket_nb) * bucket_len
+    idx_arr = np.concatenate((
+        [0, len(y_vis) - 1],
+        bucket_start_arr + np.argmin(y_bucket, axis=1),
+        bucket_start_arr + np.argmax(y_bucket, axis=1),
+    ))
+    # Padding indexes map to last point
+    idx_arr = np.unique(np.minimum(idx_arr, len(y_vis) - 1))
+
+    return (x_vis[idx_arr], y_vis[idx_arr])
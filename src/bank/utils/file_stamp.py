@@ -0,0 +1,20 @@
+"""
+File stamp
+"""
+
+import os
+from typing import List
+
+def get_file_stamp(path: str) -> List[int]:
+    """
+    Get file stamp : [modification time (ns), size]
+    Changes when file is written, or folder entries are added or removed
+    None if file does not exist
+    """
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return [stat.st_mtime_ns, stat.st_size]
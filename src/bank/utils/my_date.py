@@ -2,11 +2,21 @@
 Utils
 """
 
-from datetime import date
+from datetime import (date, datetime)
+from functools import lru_cache
 
 # datetime date format
 FMT_DATE = "%Y-%m-%d"
 
+@lru_cache(maxsize=8192)
+def parse_date(date_str: str) -> datetime:
+    """
+    Parse datetime from string with date format
+    Cached : same date string gives same datetime object
+    """
+
+    return datetime.strptime(date_str, FMT_DATE)
+
 # Get next month of date
 def get_next_month(date_in: date):
     """
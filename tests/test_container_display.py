@@ -0,0 +1,111 @@
+"""
+Container display tests
+Browse driven by keys on fake curses windows
+"""
+
+from datetime import datetime, timedelta
+import tempfile
+from typing import Any, List
+import unittest
+from unittest import mock
+
+from bank.display.my_curses.main import DisplayerMain, KeyId
+from bank.display.my_curses.implem.statement_display import DisplayerStatement
+from bank.internal import Operation, Statement
+
+class BrowseEnd(Exception):
+    """
+    No more key to browse
+    """
+
+class FakeWin():
+    """
+    Fake curses window, keys read from list
+
+    Args:
+        key_list (List[int]): Keys to read
+        is_burst (bool): Are keys pending, read in one batch, else read one by one
+    """
+
+    def __init__(self, key_list: List[int] = None, is_burst: bool = False) -> None:
+        self.key_list: List[int] = key_list if key_list is not None else []
+        self.is_burst = is_burst
+        self.timeout_ms = -1
+
+    def getmaxyx(self) -> tuple:
+        """Get size"""
+        return (27, 120)
+
+    def timeout(self, timeout_ms: int) -> None:
+        """Set read timeout, negative to wait"""
+        self.timeout_ms = timeout_ms
+
+    def getch(self) -> int:
+        """Get key, -1 if none pending"""
+
+        if self.timeout_ms >= 0 and not self.is_burst:
+            return -1
+        if len(self.key_list) == 0:
+            if self.timeout_ms >= 0:
+                return -1
+            raise BrowseEnd()
+        return self.key_list.pop(0)
+
+    def __getattr__(self, name: str) -> Any:
+        # Drawing ignored
+        return lambda *arg_list: None
+
+class TestContainerDisplay(unittest.TestCase):
+    """
+    Container display tests
+    """
+
+    def setUp(self) -> None:
+
+        patcher = mock.patch.multiple(
+            "curses", newwin=lambda *arg_list: FakeWin(), init_pair=mock.DEFAULT,
+            doupdate=mock.DEFAULT, color_pair=lambda pair_id: 0, ACS_HLINE=0, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        # No operation file : operations added
+        self.stat = Statement(tmp_dir.name, "stat")
+        date = datetime(2020, 1, 1)
+        self.stat.add_ope_list([
+            Operation(date + timedelta(days=idx), "cb", "tier", "cat", "desc", -100)
+            for idx in range(1000)])
+
+    def browse(self, key_list: List[int], is_burst: bool) -> DisplayerStatement:
+        """
+        Browse statement with keys
+        """
+
+        disp = DisplayerMain(FakeWin(list(key_list), is_burst))
+        stat_disp = DisplayerStatement(disp, self.stat)
+        with self.assertRaises(BrowseEnd):
+            stat_disp.browse_container()
+
+        return stat_disp
+
+    def test_page_then_select_burst(self) -> None:
+        """
+        Keys after page key act on displayed item, as when typed one by one
+        """
+
+        key_list = [KeyId.PAGE_DOWN] * 10 + [KeyId.SPACE]
+
+        for is_burst in [False, True]:
+            stat_disp = self.browse(key_list, is_burst)
+            self.assertEqual(stat_disp.item_focus_idx, 30)
+            self.assertEqual(stat_disp.get_item_sel_list(), [self.stat.ope_list[30]])
+
+        # Then down : view kept
+        stat_disp = self.browse(key_list + [KeyId.DOWN], True)
+        self.assertEqual(stat_disp.item_focus_idx, 30)
+        self.assertIs(stat_disp.item_hl, self.stat.ope_list[31])
+
+if __name__ == "__main__":
+    unittest.main()